@@ -1,8 +1,20 @@
 """Compute descriptive statistics from a file of numbers."""
 
+import os
 import sys
 import time
 
+# Approximate mode: lines per sampled cluster, default lines sampled,
+# bytes read to size the clusters, and files small enough to scan
+# completely instead of sampling.
+BLOCK_LINES = 32
+DEFAULT_SAMPLE_SIZE = 10000
+PROBE_BYTES = 1 << 16
+FULL_SCAN_BYTES = 1 << 20
+
+# Two-sided 95% standard normal quantile.
+Z_95 = 1.959963984540054
+
 
 def read_data(filepath):
     """Read data from a file, one entry per line.
@@ -25,6 +37,107 @@ def read_data(filepath):
     return total_count, numbers
 
 
+def line_ranges(filepath, parts):
+    """Split *filepath* into up to *parts* byte ranges on line boundaries.
+
+    Returns a list of (start, end) offsets covering the whole file.
+    """
+    file_size = os.path.getsize(filepath)
+    bounds = [0]
+    with open(filepath, "rb") as file_handle:
+        for index in range(1, parts):
+            offset = file_size * index // parts
+            if offset <= bounds[-1]:
+                continue
+            file_handle.seek(offset - 1)
+            file_handle.readline()
+            position = file_handle.tell()
+            if bounds[-1] < position < file_size:
+                bounds.append(position)
+    bounds.append(file_size)
+    return list(zip(bounds, bounds[1:]))
+
+
+def text_lines(raw):
+    """Return the lines text mode reads from one binary line *raw*.
+
+    Text mode also breaks lines at a lone carriage return, which a
+    binary readline() keeps inside the line.
+    """
+    text = raw.decode("utf-8")
+    if "\r" not in text:
+        return (text,)
+    return text.replace("\r\n", "\n").split("\r")
+
+
+def read_lines(file_handle, start, end):
+    """Parse the lines of a binary file that start in [start, end).
+
+    *start* need not fall on a line boundary: reading resumes at the
+    first line starting at or after it.  Returns (total_count, numbers,
+    errors) where errors holds the messages for invalid entries, in
+    file order.
+    """
+    if start:
+        file_handle.seek(start - 1)
+        file_handle.readline()  # Resync on the next line boundary.
+    else:
+        file_handle.seek(0)
+    total_count = 0
+    numbers = []
+    errors = []
+    position = file_handle.tell()
+    while position < end:
+        raw = file_handle.readline()
+        if not raw:
+            break
+        position += len(raw)
+        for line in text_lines(raw):
+            stripped = line.strip()
+            if not stripped:
+                continue
+            total_count += 1
+            try:
+                numbers.append(float(stripped))
+            except ValueError:
+                errors.append(
+                    f"Error: '{stripped}' is not a valid number, skipping.")
+    return total_count, numbers, errors
+
+
+def read_range(filepath, start, end):
+    """Parse the lines starting in the byte range [start, end) of a file.
+
+    Returns (total_count, numbers, errors) as read_lines does.
+    """
+    with open(filepath, "rb") as file_handle:
+        return read_lines(file_handle, start, end)
+
+
+def read_data_parallel(filepath, workers):
+    """Read data like read_data, parsing byte ranges in *workers* processes.
+
+    Falls back to read_data inside a daemon process (a program-server
+    worker), which cannot have children.  multiprocessing is imported
+    here so the serial path does not pay for it at start-up.
+    """
+    import multiprocessing  # pylint: disable=import-outside-toplevel
+    if multiprocessing.current_process().daemon:
+        return read_data(filepath)
+    ranges = line_ranges(filepath, workers)
+    with multiprocessing.Pool(len(ranges)) as pool:
+        parts = pool.starmap(read_range, [(filepath, start, end)
+                                          for start, end in ranges])
+    total_count = 0
+    numbers = []
+    for count, part_numbers, errors in parts:
+        for message in errors:
+            print(message)
+        total_count += count
+        numbers.extend(part_numbers)
+    return total_count, numbers
+
+
 def compute_mean(numbers):
     """Return the arithmetic mean of a list of numbers."""
     total = 0.0
@@ -87,14 +200,190 @@ def compute_sqrt(value):
     return guess
 
 
-def main():
-    """Read numbers from a file and compute descriptive statistics."""
-    if len(sys.argv) < 2:
-        print("Usage: python computeStatistics.py <file>")
-        sys.exit(1)
+def cluster_size(file_handle):
+    """Return the bytes per cluster, sized from the first PROBE_BYTES."""
+    probe = file_handle.read(PROBE_BYTES)
+    return max(1, len(probe) * BLOCK_LINES // max(1, probe.count(b"\n")))
+
+
+def read_cluster(file_handle, start, end):
+    """Return (line_count, byte_count, numbers) for one cluster.
+
+    Invalid entries are reported as they are found.
+    """
+    line_count, numbers, errors = read_lines(file_handle, start, end)
+    for message in errors:
+        print(message)
+    return line_count, end - start, numbers
+
+
+def sample_clusters(filepath, sample_size, seed):
+    """Sample clusters of consecutive lines without replacement.
+
+    The file is cut into byte ranges sized to hold about BLOCK_LINES
+    lines each, judged from its first PROBE_BYTES; a cluster holds the
+    lines starting in its range.  Enough distinct ranges for
+    *sample_size* lines are drawn at random and read in file order.
+    Every range is read when the file is at most FULL_SCAN_BYTES or the
+    sample would cover it anyway.
+
+    Returns (blocks, unsampled): blocks holds (line_count, byte_count,
+    numbers) per cluster and unsampled is the share of clusters not
+    read, the finite population correction.
+    """
+    file_size = os.path.getsize(filepath)
+    with open(filepath, "rb") as file_handle:
+        cluster_bytes = cluster_size(file_handle)
+        clusters = max(1, (file_size + cluster_bytes - 1) // cluster_bytes)
+        wanted = (sample_size + BLOCK_LINES - 1) // BLOCK_LINES
+        if file_size <= FULL_SCAN_BYTES or wanted >= clusters:
+            chosen = range(clusters)
+        else:
+            import random  # pylint: disable=import-outside-toplevel
+            chosen = sorted(random.Random(seed).sample(range(clusters),
+                                                       wanted))
+        blocks = [read_cluster(file_handle, index * cluster_bytes,
+                               min(file_size, (index + 1) * cluster_bytes))
+                  for index in chosen]
+    return blocks, 1.0 - len(chosen) / clusters
 
-    start_time = time.time()
-    count, numbers = read_data(sys.argv[1])
+
+def ratio_interval(numerators, denominators, unsampled):
+    """Return (ratio, half_width) of a ratio estimated from blocks.
+
+    The half-width of the 95% confidence interval treats the blocks as
+    clusters, scaled by the finite population correction.
+    """
+    total_num = 0.0
+    total_den = 0.0
+    for numerator, denominator in zip(numerators, denominators):
+        total_num += numerator
+        total_den += denominator
+    ratio = total_num / total_den
+    blocks = len(denominators)
+    if blocks < 2:
+        return ratio, 0.0
+
+    residual = 0.0
+    for numerator, denominator in zip(numerators, denominators):
+        residual += (numerator - ratio * denominator) ** 2
+    mean_den = total_den / blocks
+    variance = residual / (blocks - 1) / (blocks * mean_den ** 2)
+    return ratio, Z_95 * compute_sqrt(variance * unsampled)
+
+
+def median_interval(blocks, median, unsampled):
+    """Return Woodruff's 95% confidence bounds for the median.
+
+    The share of values below *median* is estimated block by block like
+    MEAN, so values correlated within a block (e.g. sorted input) widen
+    the interval.  The bounds 0.5 -/+ its half-width are mapped back to
+    values through the quantiles of the sample.
+    """
+    counts = []
+    below = []
+    for _, _, numbers in blocks:
+        if not numbers:
+            continue
+        smaller = 0
+        for number in numbers:
+            if number < median:
+                smaller += 1
+        counts.append(len(numbers))
+        below.append(smaller)
+    _, half = ratio_interval(below, counts, unsampled)
+
+    sorted_nums = sorted(number for block in blocks for number in block[2])
+    last = len(sorted_nums) - 1
+    low = max(0, int((0.5 - half) * last))
+    high_position = (0.5 + half) * last
+    high = int(high_position)
+    if high < high_position:
+        high += 1
+    return sorted_nums[low], sorted_nums[min(last, high)]
+
+
+def value_totals(blocks, center=None):
+    """Return (counts, totals) for the blocks holding valid numbers.
+
+    *totals* holds each block's sum of values, or its sum of squared
+    deviations from *center* when one is given.
+    """
+    counts = []
+    totals = []
+    for _, _, numbers in blocks:
+        if not numbers:
+            continue
+        total = 0.0
+        for number in numbers:
+            total += number if center is None else (number - center) ** 2
+        counts.append(len(numbers))
+        totals.append(total)
+    return counts, totals
+
+
+def estimate_count(blocks, file_size, unsampled):
+    """Return (count, low, high) from the sampled line density."""
+    density, half = ratio_interval([block[0] for block in blocks],
+                                   [block[1] for block in blocks], unsampled)
+    return (int(file_size * density + 0.5),
+            int(file_size * (density - half) + 0.5),
+            int(file_size * (density + half) + 0.5))
+
+
+def estimate_spread(blocks, mean, unsampled):
+    """Return the (estimate, low, high) tuples for SD and VARIANCE.
+
+    SD is the population standard deviation; VARIANCE is the sample
+    variance, matching the exact mode.
+    """
+    counts, squares = value_totals(blocks, mean)
+    population_var, half = ratio_interval(squares, counts, unsampled)
+    length = 0
+    for count in counts:
+        length += count
+    correction = length / (length - 1) if length > 1 else 1.0
+    low = max(0.0, population_var - half)
+    high = population_var + half
+    return ((compute_sqrt(population_var), compute_sqrt(low),
+             compute_sqrt(high)),
+            (population_var * correction, low * correction,
+             high * correction))
+
+
+def approximate_statistics(blocks, file_size, unsampled):
+    """Estimate the statistics from sampled *blocks*.
+
+    *unsampled* is the share of the file's clusters left unread.
+
+    Returns ``{metric: (estimate, low, high)}`` with 95% confidence
+    bounds, plus the number of sampled values under ``"SAMPLE"``; or
+    None when the sample holds no valid numbers.
+    """
+    numbers = [number for block in blocks for number in block[2]]
+    if not numbers:
+        return None
+
+    counts, sums = value_totals(blocks)
+    mean, half = ratio_interval(sums, counts, unsampled)
+    median = compute_median(numbers)
+    std_dev, variance = estimate_spread(blocks, mean, unsampled)
+    return {
+        "COUNT": estimate_count(blocks, file_size, unsampled),
+        "MEAN": (mean, mean - half, mean + half),
+        "MEDIAN": (median, *median_interval(blocks, median, unsampled)),
+        "SD": std_dev,
+        "VARIANCE": variance,
+        "SAMPLE": len(numbers),
+    }
+
+
+def exact_lines(filepath, workers):
+    """Return the result lines computed from every entry in *filepath*."""
+    if workers > 1:
+        count, numbers = read_data_parallel(filepath, workers)
+    else:
+        count, numbers = read_data(filepath)
 
     if not numbers:
         print("Error: no valid numbers found in the file.")
@@ -103,19 +392,84 @@ def main():
     median = compute_median(numbers)
     mode = compute_mode(numbers)
     variance, std_dev = compute_variance_and_sd(numbers, mean)
-    elapsed = time.time() - start_time
 
     mode_str = "N/A" if mode is None else str(mode)
-    lines = [
+    return [
         f"COUNT: {count}",
         f"MEAN: {mean}",
         f"MEDIAN: {median}",
         f"MODE: {mode_str}",
         f"SD: {std_dev}",
         f"VARIANCE: {variance}",
-        f"Elapsed Time: {elapsed:.6f} seconds",
     ]
 
+
+def approximate_lines(filepath, sample_size, seed):
+    """Return the result lines estimated from a sample of *filepath*."""
+    blocks, unsampled = sample_clusters(filepath, sample_size, seed)
+    estimates = approximate_statistics(blocks, os.path.getsize(filepath),
+                                       unsampled)
+
+    if estimates is None:
+        print("Error: no valid numbers found in the sample.")
+        sys.exit(1)
+    lines = []
+    for metric in ("COUNT", "MEAN", "MEDIAN", "SD", "VARIANCE"):
+        estimate, low, high = estimates[metric]
+        lines.append(f"{metric}: {estimate} (95% CI {low} to {high})")
+    lines.append(f"SAMPLE: {estimates['SAMPLE']} values (approximate)")
+    return lines
+
+
+def usage():
+    """Print the usage message and exit."""
+    print("Usage: python computeStatistics.py <file> [--workers N] "
+          "[--approximate [--sample-size N] [--seed N]]")
+    sys.exit(1)
+
+
+def parse_args(argv):
+    """Return (filepath, options) from the command line.
+
+    *options* maps ``workers``, ``sample_size`` and ``seed``;
+    *sample_size* is None unless ``--approximate`` was given.
+    """
+    if len(argv) < 2:
+        usage()
+    approximate = False
+    values = {"--workers": 1, "--sample-size": DEFAULT_SAMPLE_SIZE,
+              "--seed": None}
+    args = argv[2:]
+    while args:
+        flag = args.pop(0)
+        if flag == "--approximate":
+            approximate = True
+        elif flag in values and args and args[0].isdecimal():
+            values[flag] = int(args.pop(0))
+        else:
+            usage()
+    if values["--workers"] < 1 or values["--sample-size"] < 1:
+        usage()
+    return argv[1], {
+        "workers": values["--workers"],
+        "sample_size": values["--sample-size"] if approximate else None,
+        "seed": values["--seed"],
+    }
+
+
+def main():
+    """Read numbers from a file and compute descriptive statistics."""
+    filepath, options = parse_args(sys.argv)
+
+    start_time = time.time()
+    if options["sample_size"] is None:
+        lines = exact_lines(filepath, options["workers"])
+    else:
+        lines = approximate_lines(filepath, options["sample_size"],
+                                  options["seed"])
+    elapsed = time.time() - start_time
+    lines.append(f"Elapsed Time: {elapsed:.6f} seconds")
+
     for line in lines:
         print(line)
 
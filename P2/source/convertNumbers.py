@@ -2,67 +2,262 @@
 
 import sys
 import time
+from array import array
 
+# Default two's-complement widths used for negative numbers.
+BINARY_BITS = 10
+HEX_BITS = 40
+
+DIGITS = "0123456789ABCDEF"
+
+# Explicit struct byte-order prefix matching this machine.
+NATIVE_ORDER = "<" if sys.byteorder == "little" else ">"
+
+# bytes.translate tables extracting one digit from a byte, keyed by
+# (shift, mask); see digit_table().
+_DIGIT_TABLES = {}
 
-def to_binary(number):
-    """Return the binary string of an integer.
 
-    Negative numbers use 10-bit two's complement.
+def to_base(value, bits_per_digit):
+    """Return the digits of a non-negative integer in base 2**bits_per_digit.
+
+    Uses successive division by the base.
     """
-    if number == 0:
+    if value == 0:
         return "0"
-    if number > 0:
-        bits = []
-        value = number
-        while value > 0:
-            bits.append(str(value % 2))
-            value //= 2
-        return "".join(reversed(bits))
-    # Negative: 10-bit two's complement
-    return to_binary(1024 + number)
-
-
-def to_hexadecimal(number):
+    base = 1 << bits_per_digit
+    chars = []
+    while value > 0:
+        chars.append(DIGITS[value % base])
+        value //= base
+    return "".join(reversed(chars))
+
+
+def twos_complement(number, width, bounded=True):
+    """Return *number* encoded as a *width*-bit two's complement value.
+
+    Raises OverflowError when *number* lies outside the width's signed
+    range.  With *bounded* false only negative numbers are checked and
+    non-negative ones are returned unchanged, however large.
+    """
+    if width < 1:
+        raise ValueError(f"bit width must be positive, got {width}")
+    limit = 1 << (width - 1)
+    if number < -limit or (bounded and number >= limit):
+        raise OverflowError(
+            f"'{number}' does not fit in {width}-bit two's complement")
+    if number >= 0:
+        return number
+    return (1 << width) + number
+
+
+def to_binary(number, width=None):
+    """Return the binary string of an integer.
+
+    By default negative numbers use 10-bit two's complement and positive
+    numbers are not limited; an explicit *width* bounds both signs.
+    """
+    if width is None:
+        return to_base(twos_complement(number, BINARY_BITS, False), 1)
+    return to_base(twos_complement(number, width), 1)
+
+
+def to_hexadecimal(number, width=None):
     """Return the hexadecimal string of an integer.
 
-    Negative numbers use 40-bit two's complement.
+    By default negative numbers use 40-bit two's complement and positive
+    numbers are not limited; an explicit *width* bounds both signs.
     """
-    hex_digits = "0123456789ABCDEF"
-    if number == 0:
-        return "0"
-    if number > 0:
-        chars = []
-        value = number
-        while value > 0:
-            chars.append(hex_digits[value % 16])
-            value //= 16
-        return "".join(reversed(chars))
-    # Negative: 40-bit two's complement (2^40 + number)
-    return to_hexadecimal(1099511627776 + number)
+    if width is None:
+        return to_base(twos_complement(number, HEX_BITS, False), 4)
+    return to_base(twos_complement(number, width), 4)
 
 
-def main():
-    """Read integers from a file and convert to binary and hex."""
-    if len(sys.argv) < 2:
-        print("Usage: python convertNumbers.py <file>")
-        sys.exit(1)
+def digit_count(width, bits_per_digit):
+    """Return how many digits a *width*-bit field needs in the output."""
+    return (width + bits_per_digit - 1) // bits_per_digit
 
-    start_time = time.time()
+
+def digit_table(shift, mask):
+    """Return a ``bytes.translate`` table from a byte to one ASCII digit.
+
+    Byte b maps to the digit ``(b >> shift) & mask``, b being read as a
+    signed byte so that a shift of 8 yields its sign extension.
+    """
+    if (shift, mask) not in _DIGIT_TABLES:
+        _DIGIT_TABLES[shift, mask] = bytes(
+            ord(DIGITS[(((value ^ 128) - 128) >> shift) & mask])
+            for value in range(256))
+    return _DIGIT_TABLES[shift, mask]
+
+
+def int64_array(values):
+    """Return the buffer *values* as a native-order ``array('q')``.
+
+    Raises TypeError unless the buffer holds signed 64-bit integers.
+    """
+    view = memoryview(values)
+    code = view.format.lstrip("@=<>!")
+    order = view.format[:len(view.format) - len(code)]
+    if view.itemsize != 8 or code not in ("q", "l") or len(order) > 1:
+        raise TypeError(
+            f"expected signed 64-bit integers, got {view.format!r}")
+    numbers = array("q")
+    numbers.frombytes(view.tobytes())
+    if order in ("<", ">", "!") and order != NATIVE_ORDER:
+        numbers.byteswap()
+    return numbers
+
+
+def convert_batch(values, width, bits_per_digit):
+    """Convert a buffer of int64 values to fixed-width digit fields.
+
+    *values* is any object exposing signed 64-bit integers through the
+    buffer protocol, e.g. ``array('q')`` or a NumPy int64 array.  Each
+    value is encoded in *width*-bit two's complement and written as
+    ``digit_count(width, bits_per_digit)`` zero-padded ASCII digits into
+    one bytearray, which is returned.  *bits_per_digit* is 1 for binary
+    and 4 for hexadecimal.  Raises OverflowError for values outside the
+    width's signed range.
+
+    The values are turned into big-endian bytes, and each output digit
+    column is one ``bytes.translate`` of a byte column through a digit
+    table stored with a slice assignment, so no Python code runs per
+    value.
+    """
+    if bits_per_digit not in (1, 4):
+        raise ValueError(
+            f"bits_per_digit must be 1 or 4, got {bits_per_digit}")
+    if width < 1:
+        raise ValueError(f"bit width must be positive, got {width}")
+    numbers = int64_array(values)
+    if not numbers:
+        return bytearray()
+    if width < 64:
+        for number in (min(numbers), max(numbers)):
+            twos_complement(number, width)
+    if sys.byteorder == "little":
+        numbers.byteswap()
+    raw = numbers.tobytes()
+
+    digits = digit_count(width, bits_per_digit)
+    output = bytearray(len(numbers) * digits)
+    for position in range(digits):
+        # Bit offset of this digit within the 64-bit big-endian value;
+        # digits left of the value are its sign extension.
+        bit = 64 - (digits - position) * bits_per_digit
+        if bit < 0:
+            byte_index, shift = 0, 8
+        else:
+            byte_index, shift = bit // 8, 8 - bits_per_digit - bit % 8
+        mask = (1 << bits_per_digit) - 1
+        if position == 0 and width % bits_per_digit:
+            mask = (1 << (width % bits_per_digit)) - 1
+        output[position::digits] = raw[byte_index::8].translate(
+            digit_table(shift, mask))
+    return output
+
+
+def convert_lines(numbered_lines, binary_bits, hex_bits):
+    """Convert (item, text) pairs into result rows.
+
+    Returns (results, errors) where errors holds the messages for
+    skipped entries, in input order.
+    """
     results = []
+    errors = []
+    for i, stripped in numbered_lines:
+        try:
+            number = int(stripped)
+        except ValueError:
+            errors.append(f"Error: '{stripped}' is not a valid integer, "
+                          "skipping.")
+            continue
+        try:
+            binary = to_binary(number, binary_bits)
+            hexadecimal = to_hexadecimal(number, hex_bits)
+        except OverflowError as error:
+            errors.append(f"Error: {error}, skipping.")
+            continue
+        results.append(f"{i}\t{number}\t{binary}\t{hexadecimal}")
+    return results, errors
 
-    with open(sys.argv[1], encoding="utf-8") as file_handle:
+
+def read_numbered_lines(filepath):
+    """Return (item, text) pairs for the non-blank lines of *filepath*."""
+    numbered_lines = []
+    with open(filepath, encoding="utf-8") as file_handle:
         for i, line in enumerate(file_handle, 1):
             stripped = line.strip()
-            if not stripped:
-                continue
-            try:
-                number = int(stripped)
-            except ValueError:
-                print(f"Error: '{stripped}' is not a valid integer, skipping.")
-                continue
-            binary = to_binary(number)
-            hexadecimal = to_hexadecimal(number)
-            results.append(f"{i}\t{number}\t{binary}\t{hexadecimal}")
+            if stripped:
+                numbered_lines.append((i, stripped))
+    return numbered_lines
+
+
+def convert_parallel(numbered_lines, binary_bits, hex_bits, workers):
+    """Run convert_lines over chunks of lines in *workers* processes.
+
+    Falls back to a single convert_lines call inside a daemon process (a
+    program-server worker), which cannot have children.  multiprocessing
+    is imported here so the serial path does not pay for it at start-up.
+    """
+    import multiprocessing  # pylint: disable=import-outside-toplevel
+    if multiprocessing.current_process().daemon:
+        return [convert_lines(numbered_lines, binary_bits, hex_bits)]
+    size = (len(numbered_lines) + workers - 1) // workers
+    chunks = [(numbered_lines[start:start + size], binary_bits, hex_bits)
+              for start in range(0, len(numbered_lines), size)]
+    with multiprocessing.Pool(len(chunks)) as pool:
+        return pool.starmap(convert_lines, chunks)
+
+
+def convert_file(filepath, binary_bits, hex_bits, workers=1):
+    """Return the result rows for every convertible line in *filepath*.
+
+    With more than one worker, chunks of lines are converted in a pool
+    of processes.
+    """
+    numbered_lines = read_numbered_lines(filepath)
+    if workers > 1 and len(numbered_lines) > 1:
+        parts = convert_parallel(numbered_lines, binary_bits, hex_bits,
+                                 workers)
+    else:
+        parts = [convert_lines(numbered_lines, binary_bits, hex_bits)]
+
+    results = []
+    for part_results, errors in parts:
+        for message in errors:
+            print(message)
+        results.extend(part_results)
+    return results
+
+
+def parse_args(argv):
+    """Return (filepath, options) from the command line.
+
+    *options* maps ``--bin-bits``, ``--hex-bits`` and ``--workers``;
+    the widths are None unless given explicitly.
+    """
+    options = {"--bin-bits": None, "--hex-bits": None, "--workers": 1}
+    if len(argv) >= 2 and len(argv) % 2 == 0:
+        for flag, value in zip(argv[2::2], argv[3::2]):
+            if flag not in options or not value.isdecimal() or int(value) < 1:
+                break
+            options[flag] = int(value)
+        else:
+            return argv[1], options
+    print("Usage: python convertNumbers.py <file> "
+          "[--bin-bits N] [--hex-bits N] [--workers N]")
+    sys.exit(1)
+
+
+def main():
+    """Read integers from a file and convert to binary and hex."""
+    filepath, options = parse_args(sys.argv)
+
+    start_time = time.time()
+    results = convert_file(filepath, options["--bin-bits"],
+                           options["--hex-bits"], options["--workers"])
 
     elapsed = time.time() - start_time
     header = "ITEM\tVALUE\tBIN\tHEX"
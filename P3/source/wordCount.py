@@ -1,8 +1,16 @@
 """Count the frequency of each distinct word in a file."""
 
+import io
+import os
 import sys
 import time
 
+# Maximum number of run files merged at once during an external sort.
+MERGE_FAN_IN = 64
+
+# Bytes of whole lines each parallel worker reads at a time.
+READ_HINT = 1 << 20
+
 
 def count_words(filepath):
     """Read words from a file and return a frequency dictionary."""
@@ -16,37 +24,264 @@ def count_words(filepath):
     return frequencies
 
 
-def main():
-    """Read words from a file and display their frequencies."""
-    if len(sys.argv) < 2:
-        print("Usage: python wordCount.py <file>")
-        sys.exit(1)
+def chunk_bounds(filepath, parts):
+    """Return offsets splitting *filepath* into up to *parts* chunks.
 
-    start_time = time.time()
-    frequencies = count_words(sys.argv[1])
+    Every chunk but the first starts right after a newline.
+    """
+    import mmap  # pylint: disable=import-outside-toplevel
+    file_size = os.path.getsize(filepath)
+    bounds = [0]
+    if file_size:
+        with open(filepath, "rb") as file_handle, \
+                mmap.mmap(file_handle.fileno(), 0,
+                          access=mmap.ACCESS_READ) as data:
+            for index in range(1, parts):
+                target = max(bounds[-1], file_size * index // parts - 1)
+                newline = data.find(b"\n", target)
+                if newline < 0 or newline + 1 >= file_size:
+                    break
+                if newline + 1 > bounds[-1]:
+                    bounds.append(newline + 1)
+    bounds.append(file_size)
+    return bounds
 
-    sorted_words = sorted(frequencies.items(),
-                          key=lambda item: (-item[1], item[0]))
 
-    total = 0
-    for _, count in sorted_words:
-        total += count
+def count_range(filepath, start, end):
+    """Return the word frequencies of the bytes [start, end) of a file.
 
-    elapsed = time.time() - start_time
+    *start* and *end* must fall on line boundaries.  Each piece read is
+    decoded with universal newlines, so lines break exactly where
+    count_words breaks them, including at a lone carriage return.
+    """
+    frequencies = {}
+    remaining = end - start
+    with open(filepath, "rb") as file_handle:
+        file_handle.seek(start)
+        while remaining > 0:
+            piece = file_handle.read(min(remaining, READ_HINT))
+            if not piece:
+                break
+            if not piece.endswith(b"\n") and len(piece) < remaining:
+                piece += file_handle.readline()  # Finish the last line.
+            remaining -= len(piece)
+            with io.TextIOWrapper(io.BytesIO(piece),
+                                  encoding="utf-8") as lines:
+                for line in lines:
+                    word = line.strip()
+                    if word:
+                        frequencies[word] = frequencies.get(word, 0) + 1
+    return frequencies
 
-    lines = []
-    for word, count in sorted_words:
-        lines.append(f"{word}\t{count}")
-    lines.append(f"Grand Total\t{total}")
 
-    for line in lines:
-        print(line)
-    print(f"Elapsed Time: {elapsed:.6f} seconds")
+def count_words_parallel(filepath, workers):
+    """Count words like count_words, using *workers* processes.
+
+    Falls back to count_words inside a daemon process (a program-server
+    worker), which cannot have children.  multiprocessing is imported
+    here so the serial path does not pay for it at start-up.
+    """
+    import multiprocessing  # pylint: disable=import-outside-toplevel
+    if multiprocessing.current_process().daemon:
+        return count_words(filepath)
+    bounds = chunk_bounds(filepath, workers)
+    with multiprocessing.Pool(len(bounds) - 1) as pool:
+        parts = pool.starmap(count_range, [(filepath, start, end)
+                                           for start, end in
+                                           zip(bounds, bounds[1:])])
+    frequencies = parts[0]
+    for part in parts[1:]:
+        for word, count in part.items():
+            frequencies[word] = frequencies.get(word, 0) + count
+    return frequencies
+
+
+def word_key(item):
+    """Sort key ordering (word, count) pairs alphabetically."""
+    return item[0]
+
+
+def frequency_key(item):
+    """Sort key ordering (word, count) pairs by count desc, then word."""
+    return (-item[1], item[0])
+
+
+def write_run(entries, temp_dir):
+    """Write (word, count) pairs to a new run file in *temp_dir*.
+
+    Each line holds ``count<TAB>word``; the word goes last so it may
+    itself contain tabs.  Returns the path of the run file.
+    """
+    # Only the --max-words path spills, so its imports stay off startup.
+    import tempfile  # pylint: disable=import-outside-toplevel
+    handle, path = tempfile.mkstemp(suffix=".run", dir=temp_dir)
+    with os.fdopen(handle, "w", encoding="utf-8") as run_file:
+        for word, count in entries:
+            run_file.write(f"{count}\t{word}\n")
+    return path
+
+
+def read_run(path):
+    """Yield the (word, count) pairs stored in a run file."""
+    with open(path, encoding="utf-8") as run_file:
+        for line in run_file:
+            count, word = line.rstrip("\n").split("\t", 1)
+            yield word, int(count)
+
+
+def merge_runs(paths, key, temp_dir):
+    """Yield the entries of sorted run files merged in *key* order.
+
+    Runs are merged in passes of at most MERGE_FAN_IN files so the
+    number of simultaneously open files stays bounded.  Each run file is
+    deleted as soon as it has been merged, so disk use does not grow
+    with the number of passes.
+    """
+    import heapq  # pylint: disable=import-outside-toplevel
+    while len(paths) > MERGE_FAN_IN:
+        merged = []
+        for start in range(0, len(paths), MERGE_FAN_IN):
+            group = paths[start:start + MERGE_FAN_IN]
+            merged.append(write_run(
+                heapq.merge(*[read_run(path) for path in group], key=key),
+                temp_dir))
+            remove_runs(group)
+        paths = merged
+    yield from heapq.merge(*[read_run(path) for path in paths], key=key)
+    remove_runs(paths)
+
+
+def remove_runs(paths):
+    """Delete the run files at *paths*."""
+    for path in paths:
+        os.remove(path)
+
+
+def sort_external(entries, max_words, key, temp_dir):
+    """Sort (word, count) pairs holding at most *max_words* in memory.
+
+    Returns an iterator over the sorted entries; it must be consumed
+    while *temp_dir* still exists.
+    """
+    runs = []
+    chunk = []
+    for entry in entries:
+        chunk.append(entry)
+        if len(chunk) >= max_words:
+            runs.append(write_run(sorted(chunk, key=key), temp_dir))
+            chunk = []
+    if chunk:
+        runs.append(write_run(sorted(chunk, key=key), temp_dir))
+    return merge_runs(runs, key, temp_dir)
+
 
+def count_words_external(filepath, max_words, temp_dir):
+    """Count words, spilling partial counts to disk as sorted runs.
+
+    At most *max_words* distinct words are held in memory; whenever the
+    limit is reached the partial counts are flushed to *temp_dir* as a
+    run sorted by word.  Returns the list of run paths.
+    """
+    runs = []
+    frequencies = {}
+    with open(filepath, encoding="utf-8") as file_handle:
+        for line in file_handle:
+            word = line.strip()
+            if not word:
+                continue
+            frequencies[word] = frequencies.get(word, 0) + 1
+            if len(frequencies) >= max_words:
+                runs.append(write_run(sorted(frequencies.items()), temp_dir))
+                frequencies = {}
+    if frequencies:
+        runs.append(write_run(sorted(frequencies.items()), temp_dir))
+    return runs
+
+
+def combine_counts(entries):
+    """Sum the counts of adjacent entries that share the same word."""
+    current_word = None
+    current_count = 0
+    for word, count in entries:
+        if word == current_word:
+            current_count += count
+            continue
+        if current_word is not None:
+            yield current_word, current_count
+        current_word = word
+        current_count = count
+    if current_word is not None:
+        yield current_word, current_count
+
+
+def sorted_words_external(filepath, max_words, temp_dir):
+    """Return an iterator of (word, count) pairs in result order.
+
+    Partial counts are k-way merged by word, then re-sorted by
+    descending count and word with a second external sort.
+    """
+    runs = count_words_external(filepath, max_words, temp_dir)
+    merged = combine_counts(merge_runs(runs, word_key, temp_dir))
+    return sort_external(merged, max_words, frequency_key, temp_dir)
+
+
+def write_results(sorted_words, start_time):
+    """Print and save the frequencies streamed from *sorted_words*."""
+    total = 0
     with open("WordCountResults.txt", "w", encoding="utf-8") as out_file:
-        for line in lines:
+        for word, count in sorted_words:
+            total += count
+            line = f"{word}\t{count}"
+            print(line)
             out_file.write(line + "\n")
-        out_file.write(f"Elapsed Time: {elapsed:.6f} seconds\n")
+        line = f"Grand Total\t{total}"
+        print(line)
+        out_file.write(line + "\n")
+
+        elapsed = time.time() - start_time
+        line = f"Elapsed Time: {elapsed:.6f} seconds"
+        print(line)
+        out_file.write(line + "\n")
+
+
+def parse_args(argv):
+    """Return (filepath, max_words, workers) from the command line.
+
+    *max_words* is None unless ``--max-words N`` was given; it cannot
+    be combined with more than one worker.
+    """
+    options = {"--max-words": None, "--workers": 1}
+    pairs = argv[2:]
+    valid = len(argv) >= 2 and len(pairs) % 2 == 0
+    for flag, value in zip(pairs[::2], pairs[1::2]):
+        valid = valid and flag in options and value.isdecimal() \
+            and int(value) > 0
+        if valid:
+            options[flag] = int(value)
+    if valid and (options["--max-words"] is None or options["--workers"] == 1):
+        return argv[1], options["--max-words"], options["--workers"]
+    print("Usage: python wordCount.py <file> [--max-words N | --workers N]")
+    sys.exit(1)
+
+
+def main():
+    """Read words from a file and display their frequencies."""
+    filepath, max_words, workers = parse_args(sys.argv)
+
+    start_time = time.time()
+    if max_words is None:
+        if workers > 1:
+            frequencies = count_words_parallel(filepath, workers)
+        else:
+            frequencies = count_words(filepath)
+        write_results(sorted(frequencies.items(), key=frequency_key),
+                      start_time)
+        return
+
+    import tempfile  # pylint: disable=import-outside-toplevel
+    with tempfile.TemporaryDirectory(prefix="wordCount-") as temp_dir:
+        write_results(sorted_words_external(filepath, max_words, temp_dir),
+                      start_time)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,412 @@
+"""Pick the backend for a program run from its input and this machine.
+
+``python autoTune.py <program> <file> [options]`` runs
+``<program>.py <file> [options]`` after choosing its backend:
+
+* the input is probed first, reading random blocks of lines to estimate
+  its line count and, for wordCount, its number of distinct words;
+* per-machine calibration (the per-line cost of the pure-Python path and
+  the cost of starting worker processes) is measured once and cached;
+* the worker count minimising the predicted run time is chosen, and
+  wordCount switches to its out-of-core mode when the distinct words
+  would not fit in memory.
+
+The decision is recorded as a ``Backend:`` line right before the
+``Elapsed Time`` line of the program's output and results file.
+"""
+
+import contextlib
+import importlib.util
+import json
+import os
+import platform
+import random
+import sys
+import tempfile
+import time
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CACHE_ENV = "AUTOTUNE_CACHE"
+
+# Program name -> (project folder, results file written by the program)
+PROGRAMS = {
+    "computeStatistics": ("P1", "StatisticsResults.txt"),
+    "convertNumbers": ("P2", "ConvertionResults.txt"),
+    "wordCount": ("P3", "WordCountResults.txt"),
+}
+
+# Options that already select a backend; the tuner leaves those runs alone.
+BACKEND_OPTIONS = ("--workers", "--max-words", "--approximate")
+
+PROBE_BLOCKS = 64
+PROBE_BLOCK_LINES = 32
+FULL_PROBE_BYTES = 1 << 20
+CALIBRATION_LINES = 50000
+MEMINFO = "/proc/meminfo"
+
+# Characters of the results file copied at a time when recording the
+# decision in it.
+COPY_CHUNK = 1 << 16
+
+# Rough in-memory cost of one distinct word beyond its characters, and
+# the share of available memory wordCount may use before spilling.
+WORD_OVERHEAD_BYTES = 120
+MEMORY_SHARE = 4
+
+
+def load_program(name):
+    """Import the program called *name* from its source file.
+
+    The module is registered in ``sys.modules`` so worker processes can
+    unpickle its functions.
+    """
+    path = os.path.join(ROOT_DIR, PROGRAMS[name][0], "source", f"{name}.py")
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def run_main(module, argv, working_dir, stdout):
+    """Run ``module.main()`` with *argv* in *working_dir*.
+
+    The program's output goes to the *stdout* stream.  Returns the exit
+    code it passed to sys.exit(), or None if it returned normally.
+    """
+    exit_code = None
+    previous_dir = os.getcwd()
+    previous_argv = sys.argv
+    os.chdir(working_dir)
+    sys.argv = argv
+    try:
+        with contextlib.redirect_stdout(stdout):
+            module.main()
+    except SystemExit as exc:
+        exit_code = exc.code
+    finally:
+        os.chdir(previous_dir)
+        sys.argv = previous_argv
+    return exit_code
+
+
+# ---------------------------------------------------------------------------
+# Input probing
+# ---------------------------------------------------------------------------
+
+def probe_lines(filepath, file_size):
+    """Return (lines, bytes_read) from a sample of *filepath*.
+
+    Files up to FULL_PROBE_BYTES are read completely; larger ones in
+    blocks of lines starting at random offsets.
+    """
+    lines = []
+    bytes_read = 0
+    rng = random.Random(file_size)
+    with open(filepath, "rb") as file_handle:
+        if file_size <= FULL_PROBE_BYTES:
+            raw_lines = file_handle.readlines()
+        else:
+            raw_lines = []
+            for _ in range(PROBE_BLOCKS):
+                file_handle.seek(rng.randrange(file_size))
+                file_handle.readline()  # Resync on the next line.
+                for _ in range(PROBE_BLOCK_LINES):
+                    raw = file_handle.readline()
+                    if not raw:
+                        break
+                    raw_lines.append(raw)
+    for raw in raw_lines:
+        bytes_read += len(raw)
+        stripped = raw.decode("utf-8", errors="replace").strip()
+        if stripped:
+            lines.append(stripped)
+    return lines, bytes_read
+
+
+def estimate_distinct(sample, total_lines):
+    """Estimate the distinct values among *total_lines* from a *sample*.
+
+    Uses the guaranteed-error estimator: values seen once in the sample
+    are scaled by sqrt(total / sampled), the rest are counted as is.
+    """
+    if not sample:
+        return 0
+    frequencies = {}
+    for value in sample:
+        frequencies[value] = frequencies.get(value, 0) + 1
+    singletons = 0
+    for count in frequencies.values():
+        if count == 1:
+            singletons += 1
+    if total_lines <= len(sample):
+        return len(frequencies)
+    scale = (total_lines / len(sample)) ** 0.5
+    estimate = scale * singletons + len(frequencies) - singletons
+    return min(total_lines, int(estimate + 0.5))
+
+
+def probe_input(filepath):
+    """Return the size, estimated lines and distinct values of a file."""
+    file_size = os.path.getsize(filepath)
+    lines, bytes_read = probe_lines(filepath, file_size)
+    if not bytes_read:
+        return {"size": file_size, "lines": 0, "distinct": 0,
+                "line_bytes": 0}
+    total_lines = int(len(lines) * file_size / bytes_read + 0.5)
+    return {
+        "size": file_size,
+        "lines": total_lines,
+        "distinct": estimate_distinct(lines, total_lines),
+        "line_bytes": bytes_read / max(1, len(lines)),
+    }
+
+
+# ---------------------------------------------------------------------------
+# Calibration
+# ---------------------------------------------------------------------------
+
+def cache_path():
+    """Return the calibration cache file for this user."""
+    if os.environ.get(CACHE_ENV):
+        return os.environ[CACHE_ENV]
+    cache_home = os.environ.get("XDG_CACHE_HOME",
+                                os.path.join(os.path.expanduser("~"),
+                                             ".cache"))
+    return os.path.join(cache_home, "good-programming-practices",
+                        "autotune.json")
+
+
+def machine_key():
+    """Identify this machine and interpreter in the calibration cache."""
+    return (f"{platform.node()}/{platform.machine()}/{os.cpu_count()}/"
+            f"python{platform.python_version()}")
+
+
+def write_calibration_input(name, path):
+    """Write CALIBRATION_LINES of typical input for program *name*."""
+    rng = random.Random(0)
+    with open(path, "w", encoding="utf-8") as out_file:
+        for _ in range(CALIBRATION_LINES):
+            if name == "computeStatistics":
+                out_file.write(f"{rng.uniform(0, 1000)}\n")
+            elif name == "convertNumbers":
+                out_file.write(f"{rng.randrange(-500, 10000000)}\n")
+            else:
+                out_file.write(f"word{rng.randrange(5000)}\n")
+
+
+def time_run(module, name, input_file, workers):
+    """Return how long program *name* takes on *input_file*."""
+    with tempfile.TemporaryDirectory(prefix="autoTune-") as work_dir, \
+            open(os.devnull, "w", encoding="utf-8") as devnull:
+        start = time.perf_counter()
+        run_main(module, [f"{name}.py", input_file, "--workers",
+                          str(workers)], work_dir, devnull)
+        return time.perf_counter() - start
+
+
+def calibrate(module, name):
+    """Measure the per-line cost and per-worker overhead of *name*.
+
+    A two-worker run is modelled as ``overhead * 2 + serial / 2``.
+    """
+    with tempfile.TemporaryDirectory(prefix="autoTune-") as data_dir:
+        input_file = os.path.join(data_dir, "calibration.txt")
+        write_calibration_input(name, input_file)
+        serial = time_run(module, name, input_file, 1)
+        parallel = time_run(module, name, input_file, 2)
+    return {
+        "line_cost": serial / CALIBRATION_LINES,
+        "worker_overhead": max(0.0, (parallel - serial / 2) / 2),
+    }
+
+
+def load_calibration(module, name):
+    """Return the cached calibration for *name*, measuring it if needed."""
+    path = cache_path()
+    cache = {}
+    if os.path.isfile(path):
+        with open(path, encoding="utf-8") as cache_file:
+            try:
+                cache = json.load(cache_file)
+            except ValueError:
+                cache = {}
+    machine = cache.setdefault(machine_key(), {})
+    if name not in machine:
+        machine[name] = calibrate(module, name)
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with open(path, "w", encoding="utf-8") as cache_file:
+            json.dump(cache, cache_file, indent=2, sort_keys=True)
+    return machine[name]
+
+
+# ---------------------------------------------------------------------------
+# Decision
+# ---------------------------------------------------------------------------
+
+def available_memory():
+    """Return the memory available to a new workload in bytes, or None.
+
+    Uses ``MemAvailable`` from MEMINFO, which counts reclaimable page
+    cache.  Only without that file falls back to sysconf's free pages,
+    which leave the cache out and so understate what can be used.
+    """
+    try:
+        with open(MEMINFO, encoding="ascii") as meminfo:
+            for line in meminfo:
+                if line.startswith("MemAvailable:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    try:
+        return os.sysconf("SC_AVPHYS_PAGES") * os.sysconf("SC_PAGE_SIZE")
+    except (AttributeError, ValueError, OSError):
+        return None
+
+
+def choose_workers(lines, calibration, cpus):
+    """Return the worker count with the lowest predicted run time."""
+    best_workers = 1
+    best_time = lines * calibration["line_cost"]
+    for workers in range(2, cpus + 1):
+        predicted = (lines * calibration["line_cost"] / workers
+                     + workers * calibration["worker_overhead"])
+        if predicted < best_time:
+            best_workers = workers
+            best_time = predicted
+    return best_workers
+
+
+def decide(name, profile, calibration, cpus, memory):
+    """Return (options, summary) for running program *name*.
+
+    *options* are the backend flags to pass to the program and
+    *summary* describes the choice for the ``Backend:`` line.
+    """
+    reason = f"~{profile['lines']} lines, {cpus} CPUs"
+    if name == "wordCount":
+        reason = f"~{profile['lines']} lines, ~{profile['distinct']} " \
+            f"distinct, {cpus} CPUs"
+        word_bytes = profile["line_bytes"] + WORD_OVERHEAD_BYTES
+        budget = None if memory is None else memory // MEMORY_SHARE
+        if budget is not None and profile["distinct"] * word_bytes > budget:
+            max_words = max(1000, int(budget // word_bytes))
+            return (["--max-words", str(max_words)],
+                    f"external (max-words={max_words}); autotuned: {reason}")
+
+    workers = choose_workers(profile["lines"], calibration, cpus)
+    if workers == 1:
+        return [], f"pure Python (workers=1); autotuned: {reason}"
+    return (["--workers", str(workers)],
+            f"multiprocess (workers={workers}); autotuned: {reason}")
+
+
+class SummaryWriter:
+    """Text stream inserting ``Backend: summary`` before ``Elapsed Time``.
+
+    Complete lines are passed on to *target* as they are written; only
+    an unfinished last line is held back until it ends or close() is
+    called.  The summary is inserted once, before the first line that
+    starts with ``Elapsed Time``.
+    """
+
+    def __init__(self, target, summary):
+        self.target = target
+        self.summary = summary
+        self.pending = ""
+
+    def write(self, text):
+        """Pass on the complete lines of *text*; return its length."""
+        if "\n" not in text:
+            self.pending += text
+            return len(text)
+        data = self.pending + text
+        cut = data.rfind("\n") + 1
+        self.pending = data[cut:]
+        lines = data[:cut]
+        if self.summary is not None and "Elapsed Time" in lines:
+            lines = self.mark(lines)
+        self.target.write(lines)
+        return len(text)
+
+    def mark(self, lines):
+        """Return *lines* with the summary inserted before Elapsed Time."""
+        if lines.startswith("Elapsed Time"):
+            index = 0
+        else:
+            index = lines.find("\nElapsed Time") + 1
+            if not index:
+                return lines
+        summary_line = f"Backend: {self.summary}\n"
+        self.summary = None
+        return lines[:index] + summary_line + lines[index:]
+
+    def flush(self):
+        """Flush the target; an unfinished line stays held back."""
+        self.target.flush()
+
+    def close(self):
+        """Pass on the unfinished last line, if any."""
+        if self.pending:
+            if self.summary is not None:
+                self.pending = self.mark(self.pending)
+            self.target.write(self.pending)
+            self.pending = ""
+
+
+def insert_summary_file(path, summary):
+    """Insert the summary into the file at *path*, streaming it.
+
+    The file is copied through a SummaryWriter in COPY_CHUNK pieces to
+    a temporary file in the same directory that then replaces *path*,
+    so it is never held in memory and is left intact if rewriting fails.
+    """
+    handle, temp_path = tempfile.mkstemp(
+        dir=os.path.dirname(os.path.abspath(path)), suffix=".tmp")
+    try:
+        with os.fdopen(handle, "w", encoding="utf-8") as out_file, \
+                open(path, encoding="utf-8") as in_file:
+            writer = SummaryWriter(out_file, summary)
+            for chunk in iter(lambda: in_file.read(COPY_CHUNK), ""):
+                writer.write(chunk)
+            writer.close()
+        os.chmod(temp_path, os.stat(path).st_mode & 0o777)
+        os.replace(temp_path, path)
+    except BaseException:
+        os.remove(temp_path)
+        raise
+
+
+def main():
+    """Choose the backend, run the program and record the decision."""
+    if len(sys.argv) < 3 or sys.argv[1] not in PROGRAMS:
+        names = "|".join(PROGRAMS)
+        print(f"Usage: python autoTune.py <{names}> <file> [options]")
+        sys.exit(1)
+
+    name, filepath, args = sys.argv[1], sys.argv[2], sys.argv[3:]
+    module = load_program(name)
+    if any(arg in BACKEND_OPTIONS for arg in args):
+        options, summary = [], "as requested on the command line"
+    else:
+        options, summary = decide(name, probe_input(filepath),
+                                  load_calibration(module, name),
+                                  os.cpu_count() or 1, available_memory())
+
+    # Output streams through as the program prints it; the Backend line
+    # only appears before an Elapsed Time line, i.e. after a success.
+    stdout = SummaryWriter(sys.stdout, summary)
+    try:
+        exit_code = run_main(module,
+                             [f"{name}.py", filepath, *args, *options],
+                             os.getcwd(), stdout)
+    finally:
+        stdout.close()
+    if exit_code:
+        sys.exit(exit_code)
+    insert_summary_file(PROGRAMS[name][1], summary)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""Drop-in client for the program server.
+
+``python programClient.py <program> <file> [options]`` behaves like
+``python <program>.py <file> [options]``: it prints the same output,
+writes the same results file to the current directory and exits with the
+same status.  If no server is listening, the program runs locally.
+"""
+
+import json
+import os
+import socket
+import sys
+
+import programProtocol
+
+
+def send_request(sock, program, filepath, args=()):
+    """Send one request, streaming *filepath* as the payload."""
+    programProtocol.send_json(sock, {"program": program, "args": list(args)})
+    with open(filepath, "rb") as payload_file:
+        while True:
+            chunk = payload_file.read(programProtocol.CHUNK_SIZE)
+            if not chunk:
+                break
+            programProtocol.send_frame(sock, chunk)
+    programProtocol.send_frame(sock, b"")
+
+
+def receive_response(sock):
+    """Return the next response message from the server."""
+    frame = programProtocol.recv_frame(sock)
+    if frame is None:
+        raise ConnectionError("server closed the connection")
+    return json.loads(frame.decode("utf-8"))
+
+
+def run_pipelined(sock, jobs):
+    """Send every ``(program, filepath, args)`` job, then read responses.
+
+    Returns the responses in the same order as *jobs*.
+    """
+    for program, filepath, args in jobs:
+        send_request(sock, program, filepath, args)
+    return [receive_response(sock) for _ in jobs]
+
+
+def connect(socket_path):
+    """Return a socket connected to the server, or None if none listens."""
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.connect(socket_path)
+    except OSError:
+        sock.close()
+        return None
+    return sock
+
+
+def run_locally(program, argv):
+    """Run *program* in this interpreter as its own command line would."""
+    import runpy  # pylint: disable=import-outside-toplevel
+    sys.argv = [f"{program}.py", *argv]
+    runpy.run_path(programProtocol.PROGRAMS[program][0], run_name="__main__")
+
+
+def main():
+    """Forward the command line to the server and replay its response."""
+    if len(sys.argv) < 3 or sys.argv[1] not in programProtocol.PROGRAMS:
+        names = "|".join(programProtocol.PROGRAMS)
+        print(f"Usage: python programClient.py <{names}> <file> [options]")
+        sys.exit(1)
+
+    program, filepath, args = sys.argv[1], sys.argv[2], sys.argv[3:]
+    socket_path = os.environ.get(programProtocol.SOCKET_ENV,
+                                 programProtocol.DEFAULT_SOCKET)
+    sock = connect(socket_path)
+    if sock is None:
+        run_locally(program, sys.argv[2:])
+        return
+
+    with sock:
+        send_request(sock, program, filepath, args)
+        response = receive_response(sock)
+
+    sys.stdout.write(response["stdout"])
+    sys.stderr.write(response["stderr"])
+    if response["output"] is not None:
+        with open(response["output_name"], "w", encoding="utf-8") as out_file:
+            out_file.write(response["output"])
+    sys.exit(response["returncode"])
+
+
+if __name__ == "__main__":
+    main()
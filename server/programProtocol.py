@@ -0,0 +1,74 @@
+"""Wire protocol shared by the program server and its client.
+
+Messages are length-prefixed frames: a 4-byte big-endian size followed
+by that many bytes.  This module imports nothing beyond json, os and
+struct, so the client can use it without paying for the server's
+multiprocessing and socketserver machinery at start-up.
+"""
+
+import json
+import os
+import struct
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SOCKET_ENV = "PROGRAM_SERVER_SOCKET"
+CHUNK_SIZE = 65536
+HEADER = struct.Struct("!I")
+
+# Same lookup as tempfile.gettempdir() on POSIX, without importing it.
+TEMP_DIR = next((os.environ[name] for name in ("TMPDIR", "TEMP", "TMP")
+                 if os.environ.get(name)), "/tmp")
+DEFAULT_SOCKET = os.path.join(TEMP_DIR, "good-programming-practices.sock")
+
+# Program name -> (source path, results file written by the program)
+PROGRAMS = {
+    "computeStatistics": (
+        os.path.join(ROOT_DIR, "P1", "source", "computeStatistics.py"),
+        "StatisticsResults.txt",
+    ),
+    "convertNumbers": (
+        os.path.join(ROOT_DIR, "P2", "source", "convertNumbers.py"),
+        "ConvertionResults.txt",
+    ),
+    "wordCount": (
+        os.path.join(ROOT_DIR, "P3", "source", "wordCount.py"),
+        "WordCountResults.txt",
+    ),
+}
+
+
+def recv_exactly(sock, size):
+    """Read exactly *size* bytes, or return None on a clean EOF."""
+    data = bytearray()
+    while len(data) < size:
+        chunk = sock.recv(size - len(data))
+        if not chunk:
+            if data:
+                raise ConnectionError("connection closed mid-frame")
+            return None
+        data.extend(chunk)
+    return bytes(data)
+
+
+def send_frame(sock, data):
+    """Send *data* as one length-prefixed frame."""
+    sock.sendall(HEADER.pack(len(data)) + data)
+
+
+def recv_frame(sock):
+    """Return the next frame's bytes, or None if the peer closed."""
+    header = recv_exactly(sock, HEADER.size)
+    if header is None:
+        return None
+    (size,) = HEADER.unpack(header)
+    if size == 0:
+        return b""
+    data = recv_exactly(sock, size)
+    if data is None:
+        raise ConnectionError("connection closed mid-frame")
+    return data
+
+
+def send_json(sock, message):
+    """Send *message* as a JSON frame."""
+    send_frame(sock, json.dumps(message).encode("utf-8"))
@@ -0,0 +1,262 @@
+"""Serve the statistics, conversion and word-count programs over a socket.
+
+The server keeps a pool of worker processes with every program already
+imported, so each call skips interpreter start-up.  Clients talk to it
+over a Unix domain socket using length-prefixed frames:
+
+* request:  a JSON header ``{"program": NAME, "args": [...]}`` followed by
+  the input file streamed as data frames and closed by an empty frame;
+* response: one JSON frame with ``returncode``, ``stdout``, ``stderr``,
+  ``output_name`` and ``output`` (the results file, or null).
+
+Several requests may be pipelined on one connection; responses come back
+in request order.
+"""
+
+import argparse
+import contextlib
+import importlib.util
+import io
+import json
+import multiprocessing
+import os
+import queue
+import socket
+import socketserver
+import stat
+import sys
+import tempfile
+import threading
+import traceback
+
+from programProtocol import (
+    DEFAULT_SOCKET, PROGRAMS, SOCKET_ENV, recv_frame, send_json,
+)
+
+TEMP_PREFIX = "programServer-"
+
+# Modules imported once per worker process by init_worker().
+_MODULES = {}
+
+
+def load_program(name):
+    """Import the program called *name* from its source file."""
+    spec = importlib.util.spec_from_file_location(name, PROGRAMS[name][0])
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def init_worker():
+    """Import every program so requests run against warm modules."""
+    for name in PROGRAMS:
+        _MODULES[name] = load_program(name)
+
+
+# ---------------------------------------------------------------------------
+# Payloads
+# ---------------------------------------------------------------------------
+
+def receive_payload(sock, spool_dir):
+    """Stream data frames into a new file under *spool_dir*.
+
+    Stops at the first empty frame and returns the file path.  If the
+    payload is cut short, the partial file is removed before the error
+    propagates.
+    """
+    handle, path = tempfile.mkstemp(suffix=".txt", dir=spool_dir)
+    try:
+        with os.fdopen(handle, "wb") as payload_file:
+            while True:
+                chunk = recv_frame(sock)
+                if chunk is None:
+                    raise ConnectionError("connection closed mid-payload")
+                if not chunk:
+                    return path
+                payload_file.write(chunk)
+    except BaseException:
+        os.remove(path)
+        raise
+
+
+# ---------------------------------------------------------------------------
+# Worker side
+# ---------------------------------------------------------------------------
+
+def exit_status(code, stderr):
+    """Map a SystemExit code to a process return code like python does."""
+    if code is None:
+        return 0
+    if isinstance(code, int):
+        return code
+    stderr.write(f"{code}\n")
+    return 1
+
+
+def error_response(returncode, stderr):
+    """Return a response for a request that produced no program output."""
+    return {"returncode": returncode, "stdout": "", "stderr": stderr,
+            "output_name": None, "output": None}
+
+
+def run_job(name, args, payload_path):
+    """Run program *name* on *payload_path* as if from the command line.
+
+    The program runs in a scratch directory so its results file can be
+    collected; returns the response message.
+    """
+    if name not in PROGRAMS:
+        return error_response(2, f"Error: unknown program '{name}'.\n")
+
+    stdout = io.StringIO()
+    stderr = io.StringIO()
+
+    output_name = PROGRAMS[name][1]
+    previous_dir = os.getcwd()
+    previous_argv = sys.argv
+    returncode = 0
+    with tempfile.TemporaryDirectory(prefix=TEMP_PREFIX) as work_dir:
+        os.chdir(work_dir)
+        sys.argv = [f"{name}.py", payload_path, *args]
+        try:
+            with contextlib.redirect_stdout(stdout):
+                _MODULES[name].main()
+        except SystemExit as exc:
+            returncode = exit_status(exc.code, stderr)
+        # Report failures like the interpreter would instead of
+        # killing the worker.
+        except Exception:  # pylint: disable=broad-exception-caught
+            stderr.write(traceback.format_exc())
+            returncode = 1
+        finally:
+            os.chdir(previous_dir)
+            sys.argv = previous_argv
+
+        output = None
+        output_path = os.path.join(work_dir, output_name)
+        if os.path.isfile(output_path):
+            with open(output_path, encoding="utf-8") as out_file:
+                output = out_file.read()
+
+    return {"returncode": returncode, "stdout": stdout.getvalue(),
+            "stderr": stderr.getvalue(), "output_name": output_name,
+            "output": output}
+
+
+# ---------------------------------------------------------------------------
+# Server side
+# ---------------------------------------------------------------------------
+
+class ProgramRequestHandler(socketserver.BaseRequestHandler):
+    """Read pipelined requests and answer them in order."""
+
+    def handle(self):
+        """Submit each request to the pool as soon as it arrives."""
+        pending = queue.Queue()
+        writer = threading.Thread(target=self.send_responses, args=(pending,))
+        writer.start()
+        try:
+            while True:
+                header = recv_frame(self.request)
+                if header is None:
+                    break
+                message = json.loads(header.decode("utf-8"))
+                payload_path = receive_payload(self.request,
+                                               self.server.spool_dir)
+                job = self.server.pool.apply_async(
+                    run_job,
+                    (message.get("program"), message.get("args", []),
+                     payload_path),
+                )
+                pending.put((job, payload_path))
+        finally:
+            pending.put(None)
+            writer.join()
+
+    def send_responses(self, pending):
+        """Send each finished job's response in submission order."""
+        while True:
+            item = pending.get()
+            if item is None:
+                return
+            job, payload_path = item
+            try:
+                response = job.get()
+            # A dead worker or an unpicklable result must not stall the
+            # responses still queued behind this one.
+            except Exception:  # pylint: disable=broad-exception-caught
+                response = error_response(1, traceback.format_exc())
+            finally:
+                os.remove(payload_path)
+            try:
+                send_json(self.request, response)
+            except OSError:
+                pass  # Client went away; keep draining the queue.
+
+
+class ProgramServer(socketserver.ThreadingMixIn,
+                    socketserver.UnixStreamServer):
+    """Unix socket server dispatching requests to a warm worker pool."""
+
+    daemon_threads = True
+
+    def __init__(self, socket_path, pool, spool_dir):
+        self.pool = pool
+        self.spool_dir = spool_dir
+        super().__init__(socket_path, ProgramRequestHandler)
+
+
+def remove_stale_socket(socket_path):
+    """Remove a socket left behind at *socket_path* by a dead server.
+
+    Exits with an error if the path is not a socket or a server is
+    still listening on it.
+    """
+    try:
+        mode = os.stat(socket_path).st_mode
+    except FileNotFoundError:
+        return
+    if not stat.S_ISSOCK(mode):
+        sys.exit(f"Error: '{socket_path}' exists and is not a socket.")
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+        try:
+            probe.connect(socket_path)
+        except OSError:
+            os.remove(socket_path)
+            return
+    sys.exit(f"Error: a server is already listening on '{socket_path}'.")
+
+
+def serve(socket_path, workers):
+    """Serve requests on *socket_path* until interrupted."""
+    remove_stale_socket(socket_path)
+    with multiprocessing.Pool(workers, initializer=init_worker) as pool, \
+            tempfile.TemporaryDirectory(prefix=TEMP_PREFIX) as spool_dir, \
+            ProgramServer(socket_path, pool, spool_dir) as server:
+        print(f"Serving on {socket_path} with {workers} workers")
+        sys.stdout.flush()
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            os.remove(socket_path)
+
+
+def main():
+    """Parse the command line and run the server."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--socket", default=os.environ.get(SOCKET_ENV, DEFAULT_SOCKET),
+        help=f"Unix socket path (default: ${SOCKET_ENV} or {DEFAULT_SOCKET})",
+    )
+    parser.add_argument(
+        "--workers", type=int, default=os.cpu_count() or 1,
+        help="number of worker processes (default: CPU count)",
+    )
+    options = parser.parse_args()
+    serve(options.socket, max(1, options.workers))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,13 @@
 """Shared fixtures and helpers for all test modules."""
 
+import contextlib
+import functools
+import importlib.util
+import io
 import os
 import subprocess
+import sys
+import traceback
 
 import pytest
 
@@ -9,16 +15,94 @@ ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 AUX_DIR = os.path.join(ROOT_DIR, "aux")
 
 
-def run_program(program_path, input_file, working_dir=None):
+def pytest_addoption(parser):
+    """Add the switches for the large-input tier."""
+    parser.addoption(
+        "--run-large", action="store_true",
+        help="run the large generated-input correctness/perf tests",
+    )
+    parser.addoption(
+        "--large-mb", type=float, default=8.0,
+        help="size in MB each reference input is replicated up to",
+    )
+
+
+def pytest_configure(config):
+    """Register the ``large`` marker."""
+    config.addinivalue_line(
+        "markers", "large: large generated-input tests (need --run-large)",
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip ``large`` tests unless ``--run-large`` was given."""
+    if config.getoption("--run-large"):
+        return
+    skip_large = pytest.mark.skip(reason="needs --run-large")
+    for item in items:
+        if "large" in item.keywords:
+            item.add_marker(skip_large)
+
+
+def exit_status(code, stderr):
+    """Map a SystemExit code to a process return code like python does."""
+    if code is None:
+        return 0
+    if isinstance(code, int):
+        return code
+    stderr.write(f"{code}\n")
+    return 1
+
+
+def run_program(program_path, input_file, working_dir=None, extra_args=()):
+    """Run a program's ``main()`` in this interpreter.
+
+    Behaves like :func:`run_program_subprocess` without the cost of
+    starting a new interpreter: returns a CompletedProcess with the
+    captured stdout, stderr, and returncode.  The program runs with
+    *working_dir* as cwd so output files land there.
+    """
+    if working_dir is None:
+        working_dir = os.path.dirname(program_path)
+    module = load_program(program_path)
+    args = [program_path, input_file, *extra_args]
+    stdout = io.StringIO()
+    stderr = io.StringIO()
+    returncode = 0
+
+    previous_dir = os.getcwd()
+    previous_argv = sys.argv
+    os.chdir(working_dir)
+    sys.argv = args
+    try:
+        with contextlib.redirect_stdout(stdout), \
+                contextlib.redirect_stderr(stderr):
+            module.main()
+    except SystemExit as exc:
+        returncode = exit_status(exc.code, stderr)
+    except Exception:  # noqa: BLE001 — report like the interpreter would
+        stderr.write(traceback.format_exc())
+        returncode = 1
+    finally:
+        os.chdir(previous_dir)
+        sys.argv = previous_argv
+    return subprocess.CompletedProcess(
+        args, returncode, stdout.getvalue(), stderr.getvalue(),
+    )
+
+
+def run_program_subprocess(program_path, input_file, working_dir=None,
+                           extra_args=()):
     """Run a Python program via subprocess.
 
     Returns the CompletedProcess with stdout, stderr, and returncode.
     The program runs with *working_dir* as cwd so output files land there.
+    *extra_args* are appended after the input file on the command line.
     """
     if working_dir is None:
         working_dir = os.path.dirname(program_path)
     result = subprocess.run(
-        ["python3", program_path, input_file],
+        ["python3", program_path, input_file, *extra_args],
         capture_output=True,
         text=True,
         cwd=working_dir,
@@ -27,11 +111,88 @@ def run_program(program_path, input_file, working_dir=None):
     return result
 
 
+def heavy_imports(program_path, input_file, working_dir):
+    """Return the start-up-heavy modules a default run of a program loads.
+
+    The program runs in a fresh interpreter so modules imported by the
+    test session do not count.
+    """
+    code = (
+        "import runpy, sys\n"
+        f"sys.argv = [{program_path!r}, {input_file!r}]\n"
+        f"runpy.run_path({program_path!r}, run_name='__main__')\n"
+        "print(sorted({'heapq', 'mmap', 'multiprocessing', 'random',"
+        " 'tempfile'} & set(sys.modules)), file=sys.stderr)\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True,
+        cwd=working_dir, timeout=120, check=False,
+    )
+    assert result.returncode == 0, result.stderr
+    return result.stderr.strip()
+
+
+def without_elapsed(text):
+    """Return the lines of *text* minus the ``Elapsed Time`` line."""
+    return [ln for ln in text.splitlines()
+            if not ln.startswith("Elapsed Time")]
+
+
+def assert_same_output(actual, expected, output_name):
+    """Assert two runs printed and wrote the same, timings aside.
+
+    *actual* and *expected* are (CompletedProcess, working_dir) pairs;
+    *output_name* is the results file each run wrote in its directory.
+    """
+    (actual_run, actual_dir), (expected_run, expected_dir) = actual, expected
+    assert actual_run.returncode == expected_run.returncode, \
+        actual_run.stderr
+    assert without_elapsed(actual_run.stdout) == \
+        without_elapsed(expected_run.stdout)
+    actual_text = (actual_dir / output_name).read_text("utf-8")
+    expected_text = (expected_dir / output_name).read_text("utf-8")
+    assert without_elapsed(actual_text) == without_elapsed(expected_text)
+
+
+def assert_matches_default_run(program_path, input_file, output_name,
+                               tmp_path, extra_args):
+    """Assert a run with *extra_args* matches the run without them."""
+    default_dir = tmp_path / "default"
+    option_dir = tmp_path / "option"
+    default_dir.mkdir()
+    option_dir.mkdir()
+    expected = run_program(program_path, input_file,
+                           working_dir=str(default_dir))
+    actual = run_program(program_path, input_file,
+                         working_dir=str(option_dir), extra_args=extra_args)
+    assert expected.returncode == 0, f"stderr: {expected.stderr}"
+    assert_same_output((actual, option_dir), (expected, default_dir),
+                       output_name)
+
+
+@functools.lru_cache(maxsize=None)
+def load_program(program_path):
+    """Import the program at *program_path* as a module and return it.
+
+    Each program is imported once per test process and registered in
+    ``sys.modules`` so worker processes can unpickle its functions.
+    """
+    name = os.path.splitext(os.path.basename(program_path))[0]
+    spec = importlib.util.spec_from_file_location(name, program_path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+@functools.lru_cache(maxsize=None)
 def run_pylint(program_path):
-    """Run pylint on *program_path* and return the numeric score."""
-    import sys as _sys  # noqa: C0415 — avoid top-level shadow
+    """Run pylint on *program_path* and return the numeric score.
+
+    Scores are cached so each file is linted once per test process.
+    """
     result = subprocess.run(
-        [_sys.executable, "-m", "pylint", program_path],
+        [sys.executable, "-m", "pylint", program_path],
         capture_output=True,
         text=True,
         timeout=60,
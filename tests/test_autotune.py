@@ -0,0 +1,204 @@
+"""Tests for the backend autotuner.
+
+Decision logic is tested on the imported module; end-to-end runs go
+through the command line with a private calibration cache.
+"""
+
+import io
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+from tests.conftest import load_program, run_program, run_pylint, ROOT_DIR
+
+TUNER = os.path.join(ROOT_DIR, "autotune", "autoTune.py")
+
+CASES = [
+    ("computeStatistics", "P1", "TC5.txt", "StatisticsResults.txt"),
+    ("convertNumbers", "P2", "TC4.txt", "ConvertionResults.txt"),
+    ("wordCount", "P3", "TC5.txt", "WordCountResults.txt"),
+]
+
+CALIBRATION = {"line_cost": 1e-6, "worker_overhead": 0.01}
+
+
+@pytest.fixture(scope="module")
+def tuner():
+    """The ``autoTune`` module, imported in-process."""
+    return load_program(TUNER)
+
+
+def _run_tuner(cache_file, working_dir, *args):
+    """Run the autotuner CLI with a private calibration cache."""
+    env = dict(os.environ, AUTOTUNE_CACHE=str(cache_file))
+    return subprocess.run(
+        [sys.executable, TUNER, *args],
+        capture_output=True, text=True, cwd=working_dir, env=env,
+        timeout=120, check=False,
+    )
+
+
+def _split_summary(text):
+    """Return (lines without Backend/Elapsed, Backend line or None)."""
+    lines = text.splitlines()
+    backend = None
+    for index, line in enumerate(lines):
+        if line.startswith("Backend: "):
+            assert lines[index + 1].startswith("Elapsed Time"), (
+                "Backend line must precede Elapsed Time"
+            )
+            backend = line
+    kept = [ln for ln in lines
+            if not ln.startswith(("Backend: ", "Elapsed Time"))]
+    return kept, backend
+
+
+# ------------------------------------------------------------------
+# Decisions
+# ------------------------------------------------------------------
+
+def test_small_inputs_stay_serial(tuner):
+    """Few lines never pay for starting worker processes."""
+    assert tuner.choose_workers(1000, CALIBRATION, 8) == 1
+
+
+def test_large_inputs_use_workers(tuner):
+    """Enough lines spread over several workers, capped at the CPUs."""
+    workers = tuner.choose_workers(10_000_000, CALIBRATION, 8)
+    assert 1 < workers <= 8
+
+
+def test_word_count_spills_when_memory_is_short(tuner):
+    """wordCount goes out-of-core when distinct words exceed memory."""
+    profile = {"size": 0, "lines": 10_000_000, "distinct": 5_000_000,
+               "line_bytes": 10}
+    options, summary = tuner.decide("wordCount", profile, CALIBRATION, 8,
+                                    64 * 1024 * 1024)
+    assert options[0] == "--max-words"
+    assert int(options[1]) * (10 + tuner.WORD_OVERHEAD_BYTES) \
+        <= 64 * 1024 * 1024 // tuner.MEMORY_SHARE
+    assert summary.startswith("external")
+
+
+def test_available_memory_reads_meminfo(tuner, tmp_path, monkeypatch):
+    """MemAvailable (in kB) is used, not the smaller MemFree."""
+    meminfo = tmp_path / "meminfo"
+    meminfo.write_text("MemTotal:       16000000 kB\n"
+                       "MemFree:          500000 kB\n"
+                       "MemAvailable:    8000000 kB\n", encoding="ascii")
+    monkeypatch.setattr(tuner, "MEMINFO", str(meminfo))
+    assert tuner.available_memory() == 8000000 * 1024
+
+
+def test_available_memory_without_meminfo(tuner, tmp_path, monkeypatch):
+    """Without /proc/meminfo the sysconf free-page count is used."""
+    monkeypatch.setattr(tuner, "MEMINFO", str(tmp_path / "missing"))
+    pages = {"SC_AVPHYS_PAGES": 1000, "SC_PAGE_SIZE": 4096}
+    monkeypatch.setattr(tuner.os, "sysconf", pages.__getitem__)
+    assert tuner.available_memory() == 1000 * 4096
+
+
+def test_distinct_estimate(tuner):
+    """All-distinct samples extrapolate; repeated ones do not."""
+    assert tuner.estimate_distinct(["a", "b", "a"], 3) == 2
+    assert tuner.estimate_distinct(["a", "a", "b", "b"], 400) == 2
+    assert tuner.estimate_distinct([str(i) for i in range(100)],
+                                   10_000) == 1000
+
+
+def test_summary_writer_streams_lines(tuner):
+    """Complete lines pass straight through; Backend precedes Elapsed."""
+    target = io.StringIO()
+    writer = tuner.SummaryWriter(target, "pure Python")
+    writer.write("COUNT: 3")
+    assert target.getvalue() == ""
+    writer.write("\nElapsed ")
+    assert target.getvalue() == "COUNT: 3\n"
+    writer.write("Time: 0.1 seconds\n")
+    writer.write("tail")
+    writer.close()
+    assert target.getvalue() == (
+        "COUNT: 3\nBackend: pure Python\nElapsed Time: 0.1 seconds\ntail"
+    )
+
+
+def test_insert_summary_file(tuner, tmp_path):
+    """The results file is rewritten in place with the Backend line."""
+    results = tmp_path / "results.txt"
+    results.write_text("COUNT: 3\nElapsed Time: 0.1 seconds\n",
+                       encoding="utf-8")
+    tuner.insert_summary_file(str(results), "pure Python")
+    assert results.read_text(encoding="utf-8") == (
+        "COUNT: 3\nBackend: pure Python\nElapsed Time: 0.1 seconds\n"
+    )
+    assert [path.name for path in tmp_path.iterdir()] == ["results.txt"]
+
+
+# ------------------------------------------------------------------
+# End to end
+# ------------------------------------------------------------------
+
+@pytest.mark.parametrize("program, folder, tc_file, output_name", CASES)
+def test_autotuned_run_matches_direct_run(program, folder, tc_file,
+                                          output_name, tmp_path):
+    """Output matches a direct run apart from the recorded decision."""
+    direct_dir = tmp_path / "direct"
+    tuned_dir = tmp_path / "tuned"
+    direct_dir.mkdir()
+    tuned_dir.mkdir()
+    cache_file = tmp_path / "cache.json"
+
+    program_path = os.path.join(ROOT_DIR, folder, "source", f"{program}.py")
+    input_file = os.path.join(ROOT_DIR, folder, "tests", tc_file)
+    direct = run_program(program_path, input_file,
+                         working_dir=str(direct_dir))
+    tuned = _run_tuner(cache_file, str(tuned_dir), program, input_file)
+    assert tuned.returncode == 0, tuned.stderr
+
+    for actual, expected in (
+        (tuned.stdout, direct.stdout),
+        ((tuned_dir / output_name).read_text("utf-8"),
+         (direct_dir / output_name).read_text("utf-8")),
+    ):
+        kept, backend = _split_summary(actual)
+        assert kept == _split_summary(expected)[0]
+        assert backend and "autotuned" in backend
+
+    with open(cache_file, encoding="utf-8") as fh:
+        cache = json.load(fh)
+    (machine,) = cache.values()
+    assert set(machine[program]) == {"line_cost", "worker_overhead"}
+
+
+def test_calibration_is_cached(tmp_path):
+    """A second run reuses the cached calibration."""
+    cache_file = tmp_path / "cache.json"
+    input_file = os.path.join(ROOT_DIR, "P3", "tests", "TC5.txt")
+    _run_tuner(cache_file, str(tmp_path), "wordCount", input_file)
+    first = cache_file.read_text("utf-8")
+    _run_tuner(cache_file, str(tmp_path), "wordCount", input_file)
+    assert cache_file.read_text("utf-8") == first
+
+
+def test_explicit_backend_is_respected(tmp_path):
+    """Backend options on the command line skip tuning."""
+    cache_file = tmp_path / "cache.json"
+    input_file = os.path.join(ROOT_DIR, "P3", "tests", "TC5.txt")
+    result = _run_tuner(cache_file, str(tmp_path), "wordCount", input_file,
+                        "--max-words", "10")
+    assert result.returncode == 0, result.stderr
+    assert "Backend: as requested on the command line" in result.stdout
+    assert not cache_file.exists()
+
+
+# ------------------------------------------------------------------
+# Static analysis
+# ------------------------------------------------------------------
+
+def test_pylint_score():
+    """autoTune.py must score 10.00/10 on pylint."""
+    score = run_pylint(TUNER)
+    assert score == pytest.approx(10.0), f"pylint score is {score}"
@@ -1,14 +1,17 @@
 """TDD tests for P1 — computeStatistics.py
 
 Written *before* the implementation exists.  Every test runs the program
-as a subprocess, parses the output file, and compares to expected results.
+in-process, parses the output file, and compares to expected results.
 """
 
 import os
 
 import pytest
 
-from tests.conftest import run_program, run_pylint, parse_p1_expected, ROOT_DIR
+from tests.conftest import (
+    assert_matches_default_run, heavy_imports, run_program, run_pylint,
+    parse_p1_expected, ROOT_DIR,
+)
 
 PROGRAM = os.path.join(ROOT_DIR, "P1", "source", "computeStatistics.py")
 TESTS_DIR = os.path.join(ROOT_DIR, "P1", "tests")
@@ -106,6 +109,155 @@ def test_functional_correctness(tc, tmp_path):
     ), f"TC{tc} VARIANCE mismatch"
 
 
+# ------------------------------------------------------------------
+# Approximate (sampling) mode
+# ------------------------------------------------------------------
+
+def _parse_approximate_file(filepath):
+    """Parse approximate results into ``{metric: (estimate, low, high)}``."""
+    results = {}
+    with open(filepath, encoding="utf-8") as fh:
+        for line in fh:
+            key, _, val = line.strip().partition(": ")
+            if "(95% CI " not in val:
+                continue
+            estimate, _, interval = val.partition(" (95% CI ")
+            low, _, high = interval.rstrip(")").partition(" to ")
+            results[key] = (float(estimate), float(low), float(high))
+    return results
+
+
+def test_approximate_small_file_is_exact(tmp_path):
+    """Files small enough to scan fully give the exact statistics."""
+    input_file = os.path.join(TESTS_DIR, "TC1.txt")
+    result = run_program(PROGRAM, input_file, working_dir=str(tmp_path),
+                         extra_args=("--approximate",))
+    assert result.returncode == 0, f"stderr: {result.stderr}"
+
+    actual = _parse_approximate_file(str(tmp_path / "StatisticsResults.txt"))
+    expected = EXPECTED[1]
+    for metric in ("COUNT", "MEAN", "MEDIAN", "SD", "VARIANCE"):
+        estimate, low, high = actual[metric]
+        assert estimate == pytest.approx(
+            float(expected[metric]), rel=REL_TOL
+        ), f"{metric} mismatch"
+        if metric == "MEDIAN":
+            # Bounded by the two middle values of an even-sized sample.
+            assert low <= estimate <= high
+        else:
+            assert low == pytest.approx(estimate) == high
+
+
+def test_approximate_sampled_intervals_cover_truth(tmp_path):
+    """On a sampled file the true statistics fall inside the 95% CIs."""
+    with open(os.path.join(TESTS_DIR, "TC1.txt"), encoding="utf-8") as fh:
+        lines = [ln.strip() + "\n" for ln in fh if ln.strip()]
+    input_file = tmp_path / "input.txt"
+    with open(input_file, "w", encoding="utf-8") as fh:
+        for _ in range(1000):
+            fh.writelines(lines)
+
+    result = run_program(PROGRAM, str(input_file), working_dir=str(tmp_path),
+                         extra_args=("--approximate", "--sample-size",
+                                     "20000", "--seed", "7"))
+    assert result.returncode == 0, f"stderr: {result.stderr}"
+
+    actual = _parse_approximate_file(str(tmp_path / "StatisticsResults.txt"))
+    expected = EXPECTED[1]
+    truth = {metric: float(expected[metric])
+             for metric in ("MEAN", "MEDIAN", "SD")}
+    truth["COUNT"] = 1000.0 * len(lines)
+    for metric, value in truth.items():
+        _, low, high = actual[metric]
+        assert low <= value <= high, f"{metric} {value} not in CI"
+
+
+def test_approximate_median_covers_sorted_input(tmp_path):
+    """Sorted input: the MEDIAN CI keeps its coverage across seeds.
+
+    Values within a sampled block are then strongly correlated; an
+    interval treating them as independent lines almost never covers.
+    """
+    input_file = tmp_path / "sorted.txt"
+    with open(input_file, "w", encoding="utf-8") as fh:
+        fh.writelines(f"{value}\n" for value in range(400000))
+
+    covered = 0
+    for seed in range(20):
+        result = run_program(PROGRAM, str(input_file),
+                             working_dir=str(tmp_path),
+                             extra_args=("--approximate", "--seed",
+                                         str(seed)))
+        assert result.returncode == 0, f"stderr: {result.stderr}"
+        actual = _parse_approximate_file(
+            str(tmp_path / "StatisticsResults.txt"))
+        _, low, high = actual["MEDIAN"]
+        if low <= 199999.5 <= high:
+            covered += 1
+    assert covered >= 15, f"median covered in {covered}/20 runs"
+
+
+def test_approximate_full_coverage_is_exact(tmp_path):
+    """A sample as large as the file reads each line once: exact COUNT."""
+    with open(os.path.join(TESTS_DIR, "TC1.txt"), encoding="utf-8") as fh:
+        lines = [ln.strip() + "\n" for ln in fh if ln.strip()]
+    input_file = tmp_path / "input.txt"
+    with open(input_file, "w", encoding="utf-8") as fh:
+        for _ in range(1000):
+            fh.writelines(lines)
+
+    result = run_program(PROGRAM, str(input_file), working_dir=str(tmp_path),
+                         extra_args=("--approximate", "--sample-size",
+                                     "2000000"))
+    assert result.returncode == 0, f"stderr: {result.stderr}"
+    actual = _parse_approximate_file(str(tmp_path / "StatisticsResults.txt"))
+    assert actual["COUNT"] == (1000.0 * len(lines),) * 3
+    mean, low, high = actual["MEAN"]
+    assert low == mean == high
+    assert mean == pytest.approx(float(EXPECTED[1]["MEAN"]), rel=REL_TOL)
+
+
+@pytest.mark.parametrize("args", [
+    ("--approximate", "--sample-size"),
+    ("--approximate", "--sample-size", "0"),
+    ("--approximate", "--bogus"),
+    ("--workers", "\u00b2"),
+])
+def test_approximate_usage_errors(args, tmp_path):
+    """Malformed approximate-mode options print usage and exit 1."""
+    input_file = os.path.join(TESTS_DIR, "TC1.txt")
+    result = run_program(PROGRAM, input_file, working_dir=str(tmp_path),
+                         extra_args=args)
+    assert result.returncode == 1
+    assert result.stdout.startswith("Usage:")
+
+
+# ------------------------------------------------------------------
+# Multiprocess backend
+# ------------------------------------------------------------------
+
+@pytest.mark.parametrize("tc", range(1, 8))
+def test_workers_match_serial(tc, tmp_path):
+    """computeStatistics TC{tc}: ``--workers 3`` output matches serial."""
+    input_file = os.path.join(TESTS_DIR, f"TC{tc}.txt")
+    assert_matches_default_run(PROGRAM, input_file, "StatisticsResults.txt",
+                               tmp_path, ("--workers", "3"))
+
+
+def test_workers_split_lines_like_text_mode(tmp_path):
+    """A lone carriage return ends a line with workers, as in text mode."""
+    input_file = tmp_path / "input.txt"
+    input_file.write_bytes(b"1\r2\n3\r\n4\n" * 1000)
+    assert_matches_default_run(PROGRAM, str(input_file), "StatisticsResults.txt",
+                               tmp_path, ("--workers", "2"))
+
+
+def test_default_run_skips_heavy_imports(tmp_path):
+    """A serial run does not import multiprocessing and friends."""
+    input_file = os.path.join(TESTS_DIR, "TC1.txt")
+    assert heavy_imports(PROGRAM, input_file, str(tmp_path)) == "[]"
+
+
 # ------------------------------------------------------------------
 # Static analysis
 # ------------------------------------------------------------------
@@ -6,11 +6,17 @@ compared exactly.  TC1/TC2 expected results come from different input data
 row's binary and hex are mathematically correct for the value shown.
 """
 
+import ctypes
 import os
+import time
+from array import array
 
 import pytest
 
-from tests.conftest import run_program, run_pylint, ROOT_DIR
+from tests.conftest import (
+    assert_matches_default_run, heavy_imports, load_program, run_program,
+    run_pylint, ROOT_DIR,
+)
 
 PROGRAM = os.path.join(ROOT_DIR, "P2", "source", "convertNumbers.py")
 TESTS_DIR = os.path.join(ROOT_DIR, "P2", "tests")
@@ -189,6 +195,194 @@ def test_invalid_data_handling(tmp_path):
     )
 
 
+# ------------------------------------------------------------------
+# Configurable bit widths
+# ------------------------------------------------------------------
+
+WIDTH_VALUES = [0, 1, 5, 127, -1, -2, -50, -128]
+
+
+@pytest.fixture(scope="module")
+def converter():
+    """The ``convertNumbers`` module, imported in-process."""
+    return load_program(PROGRAM)
+
+
+@pytest.mark.parametrize("width", [8, 12, 16, 32, 64, 100])
+@pytest.mark.parametrize("value", WIDTH_VALUES)
+def test_width_matches_masked_value(converter, width, value):
+    """to_binary/to_hexadecimal encode negatives in *width* bits."""
+    mask = (1 << width) - 1
+    assert converter.to_binary(value, width) == format(value & mask, "b")
+    assert converter.to_hexadecimal(value, width) == format(value & mask, "X")
+
+
+def test_default_widths_unchanged(converter):
+    """Defaults remain 10-bit binary and 40-bit hexadecimal."""
+    assert converter.to_binary(-39) == "1111011001"
+    assert converter.to_hexadecimal(-39) == "FFFFFFFFD9"
+    assert converter.to_binary(9975410) == format(9975410, "b")
+    assert converter.to_hexadecimal(1 << 50) == format(1 << 50, "X")
+
+
+@pytest.mark.parametrize("value, width", [(-513, 10), (-129, 8), (-2, 1)])
+def test_negative_overflow_is_detected(converter, value, width):
+    """Negatives below the signed range raise instead of wrapping."""
+    with pytest.raises(OverflowError):
+        converter.to_binary(value, width)
+
+
+@pytest.mark.parametrize("value, width", [(512, 10), (128, 8), (200, 8),
+                                          (1, 1)])
+def test_positive_overflow_is_detected(converter, value, width):
+    """With an explicit width, positives above the signed range raise."""
+    with pytest.raises(OverflowError):
+        converter.to_binary(value, width)
+    with pytest.raises(OverflowError):
+        converter.to_hexadecimal(value, width)
+
+
+@pytest.mark.parametrize("args", [
+    ("--bin-bits", "\u00b2"),
+    ("--hex-bits", "0"),
+    ("--workers",),
+])
+def test_usage_errors(args, tmp_path):
+    """Malformed options print usage and exit 1 without a traceback."""
+    input_file = os.path.join(TESTS_DIR, "TC1.txt")
+    result = run_program(PROGRAM, input_file, working_dir=str(tmp_path),
+                         extra_args=args)
+    assert result.returncode == 1, result.stderr
+    assert result.stdout.startswith("Usage:")
+
+
+def test_default_run_skips_heavy_imports(tmp_path):
+    """A serial run does not import multiprocessing and friends."""
+    input_file = os.path.join(TESTS_DIR, "TC1.txt")
+    assert heavy_imports(PROGRAM, input_file, str(tmp_path)) == "[]"
+
+
+def test_overflow_is_reported_and_skipped(tmp_path):
+    """Values that do not fit the requested width are skipped."""
+    input_file = tmp_path / "input.txt"
+    input_file.write_text("5\n-200\n-100\n200\n", encoding="utf-8")
+    result = run_program(PROGRAM, str(input_file), working_dir=str(tmp_path),
+                         extra_args=("--bin-bits", "8", "--hex-bits", "8"))
+    assert result.returncode == 0, f"stderr: {result.stderr}"
+    assert "'-200' does not fit in 8-bit two's complement" in result.stdout
+    assert "'200' does not fit in 8-bit two's complement" in result.stdout
+
+    rows = _parse_conversion_output(str(tmp_path / "ConvertionResults.txt"))
+    assert [(r["value"], r["binary"], r["hex"]) for r in rows] == [
+        ("5", "101", "5"), ("-100", "10011100", "9C"),
+    ]
+
+
+# ------------------------------------------------------------------
+# Batch conversion
+# ------------------------------------------------------------------
+
+@pytest.mark.parametrize("width", [1, 8, 10, 13, 40, 63, 64])
+def test_batch_matches_scalar(converter, width):
+    """convert_batch yields zero-padded copies of the scalar results."""
+    limit = 1 << (width - 1)
+    values = array("q", [value for value in WIDTH_VALUES
+                         if -limit <= value < limit] + [limit - 1, -limit])
+    for bits_per_digit, scalar in ((1, converter.to_binary),
+                                   (4, converter.to_hexadecimal)):
+        digits = converter.digit_count(width, bits_per_digit)
+        output = converter.convert_batch(values, width, bits_per_digit)
+        assert len(output) == len(values) * digits
+        for index, value in enumerate(values):
+            field = output[index * digits:(index + 1) * digits]
+            assert field.decode("ascii") == \
+                scalar(value, width).rjust(digits, "0")
+
+
+def test_batch_accepts_numpy_int64(converter):
+    """NumPy int64 arrays convert like the equivalent ``array('q')``."""
+    numpy = pytest.importorskip("numpy")
+    values = numpy.array(WIDTH_VALUES, dtype=numpy.int64)
+    assert converter.convert_batch(values, 16, 4) == \
+        converter.convert_batch(array("q", WIDTH_VALUES), 16, 4)
+
+
+@pytest.mark.parametrize("width", [65, 100])
+def test_batch_sign_extends_wide_fields(converter, width):
+    """Fields wider than 64 bits are sign-extended like the scalar path."""
+    values = array("q", WIDTH_VALUES + [-(1 << 63), (1 << 63) - 1])
+    for bits_per_digit, scalar in ((1, converter.to_binary),
+                                   (4, converter.to_hexadecimal)):
+        digits = converter.digit_count(width, bits_per_digit)
+        output = converter.convert_batch(values, width, bits_per_digit)
+        assert output.decode("ascii") == "".join(
+            scalar(value, width).rjust(digits, "0") for value in values)
+
+
+def test_batch_accepts_big_endian_buffers(converter):
+    """Buffers with an explicit byte order are read in that order."""
+    values = (ctypes.c_int64.__ctype_be__ * 4)(5, -1, 300, -300)
+    assert memoryview(values).format == ">q"
+    assert converter.convert_batch(values, 16, 4) == \
+        converter.convert_batch(array("q", [5, -1, 300, -300]), 16, 4)
+
+
+def test_batch_rejects_overflow(converter):
+    """convert_batch raises when a value does not fit the field."""
+    with pytest.raises(OverflowError):
+        converter.convert_batch(array("q", [1, 256]), 8, 1)
+    with pytest.raises(OverflowError):
+        converter.convert_batch(array("q", [-129]), 8, 4)
+    with pytest.raises(OverflowError):
+        converter.convert_batch(array("q", [-56, 200]), 8, 1)
+
+
+@pytest.mark.parametrize("typecode", ["i", "d", "Q"])
+def test_batch_rejects_non_int64_buffers(converter, typecode):
+    """convert_batch only accepts signed 64-bit integer buffers."""
+    with pytest.raises(TypeError):
+        converter.convert_batch(array(typecode, [1, 2]), 8, 1)
+
+
+@pytest.mark.parametrize("bits_per_digit", [0, 2, 3, 8])
+def test_batch_rejects_unsupported_digits(converter, bits_per_digit):
+    """Only binary (1) and hexadecimal (4) digits are supported."""
+    with pytest.raises(ValueError):
+        converter.convert_batch(array("q", [1]), 8, bits_per_digit)
+
+
+def _best_time(function, repeat=3):
+    """Return the fastest of *repeat* timings of ``function()``."""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def test_batch_is_faster_than_scalar(converter):
+    """convert_batch beats converting the same values one at a time."""
+    values = array("q", range(-100000, 100000, 2))
+    batch = _best_time(lambda: converter.convert_batch(values, 40, 4))
+    scalar = _best_time(lambda: [converter.to_hexadecimal(value, 40)
+                                 for value in values])
+    assert batch < scalar
+
+
+# ------------------------------------------------------------------
+# Multiprocess backend
+# ------------------------------------------------------------------
+
+@pytest.mark.parametrize("tc", range(1, 5))
+def test_workers_match_serial(tc, tmp_path):
+    """convertNumbers TC{tc}: ``--workers 3`` output matches serial."""
+    input_file = os.path.join(TESTS_DIR, f"TC{tc}.txt")
+    assert_matches_default_run(PROGRAM, input_file, "ConvertionResults.txt",
+                               tmp_path, ("--workers", "3"))
+
+
 # ------------------------------------------------------------------
 # Static analysis
 # ------------------------------------------------------------------
@@ -0,0 +1,150 @@
+"""Large-input correctness and performance tier.
+
+Each reference input under ``aux/`` is replicated until it reaches
+``--large-mb`` megabytes (default 8) and the program's results are checked
+against the reference results, scaled accordingly.  Every run must also
+sustain MIN_LINES_PER_SECOND; the measured rate is recorded as the
+``lines_per_second`` property (see ``--junitxml``).  These tests only run
+with ``--run-large``::
+
+    pytest tests/ --run-large -n auto
+"""
+
+import os
+import time
+
+import pytest
+
+from tests.conftest import (
+    run_program, parse_p1_expected, parse_p3_expected, AUX_DIR, ROOT_DIR,
+)
+from tests.test_compute_statistics import _parse_statistics_file, REL_TOL
+from tests.test_word_count import _parse_word_count_output
+
+P1_PROGRAM = os.path.join(ROOT_DIR, "P1", "source", "computeStatistics.py")
+P3_PROGRAM = os.path.join(ROOT_DIR, "P3", "source", "wordCount.py")
+
+# Throughput floor per run, well below what the pure-Python paths reach
+# on a CI machine; catches pathological slowdowns without flaking.
+MIN_LINES_PER_SECOND = 50000
+
+pytestmark = pytest.mark.large
+
+
+@pytest.fixture
+def target_bytes(request):
+    """Size each replicated input is grown to."""
+    return int(request.config.getoption("--large-mb") * (1 << 20))
+
+
+def _replicate(source, target, size):
+    """Copy *source* into *target* until it holds *size* bytes.
+
+    Returns (lines of *source*, number of copies written).
+    """
+    with open(source, encoding="utf-8") as fh:
+        lines = [ln.rstrip("\n") + "\n" for ln in fh]
+    block = "".join(lines)
+    times = max(1, -(-size // len(block.encode("utf-8"))))
+    with open(target, "w", encoding="utf-8") as fh:
+        for _ in range(times):
+            fh.write(block)
+    return lines, times
+
+
+def _run_timed(record_property, program, input_file, working_dir,
+               extra_args=()):
+    """Run *program* in-process and check its throughput.
+
+    The rate in input lines per second is recorded as the
+    ``lines_per_second`` test property and must reach
+    MIN_LINES_PER_SECOND.
+    """
+    with open(input_file, "rb") as fh:
+        line_count = sum(1 for _ in fh)
+    start = time.perf_counter()
+    result = run_program(program, input_file, working_dir=working_dir,
+                         extra_args=extra_args)
+    rate = line_count / (time.perf_counter() - start)
+    record_property("lines_per_second", int(rate))
+    assert result.returncode == 0, f"stderr: {result.stderr}"
+    assert rate >= MIN_LINES_PER_SECOND, \
+        f"{rate:.0f} lines/s on {line_count} lines"
+    return result
+
+
+def _valid_numbers(lines):
+    """Return the floats parsed from *lines*, skipping invalid entries."""
+    numbers = []
+    for line in lines:
+        try:
+            numbers.append(float(line))
+        except ValueError:
+            pass
+    return numbers
+
+
+# ------------------------------------------------------------------
+# P1 — computeStatistics
+# ------------------------------------------------------------------
+
+@pytest.mark.parametrize("tc", range(1, 8))
+def test_statistics_replicated(tc, target_bytes, record_property,
+                               tmp_path):
+    """computeStatistics on TC{tc} replicated: scaled stats still match.
+
+    Replication keeps MEAN, MEDIAN and SD; COUNT scales, the sample
+    VARIANCE changes denominator, and an all-unique input gains a MODE
+    equal to its first value.
+    """
+    input_file = tmp_path / "input.txt"
+    lines, scale = _replicate(os.path.join(AUX_DIR, "P1", f"TC{tc}.txt"),
+                              input_file, target_bytes)
+    _run_timed(record_property, P1_PROGRAM, str(input_file), str(tmp_path))
+
+    actual = _parse_statistics_file(str(tmp_path / "StatisticsResults.txt"))
+    expected = parse_p1_expected()[tc]
+    valid = len(_valid_numbers(lines))
+
+    assert float(actual["COUNT"]) == float(expected["COUNT"]) * scale
+    for metric in ("MEAN", "MEDIAN", "SD"):
+        assert float(actual[metric]) == pytest.approx(
+            float(expected[metric]), rel=REL_TOL
+        ), f"TC{tc} {metric} mismatch"
+
+    variance = float(expected["VARIANCE"]) * (valid - 1) / valid
+    variance *= valid * scale / (valid * scale - 1)
+    assert float(actual["VARIANCE"]) == pytest.approx(variance, rel=REL_TOL)
+
+    if expected["MODE"] == "#N/A":
+        expected_mode = _valid_numbers(lines)[0]
+    else:
+        expected_mode = float(expected["MODE"])
+    assert float(actual["MODE"]) == pytest.approx(expected_mode, rel=REL_TOL)
+
+
+# ------------------------------------------------------------------
+# P3 — wordCount
+# ------------------------------------------------------------------
+
+@pytest.mark.parametrize("extra_args", [(), ("--max-words", "1000")],
+                         ids=["in-memory", "external"])
+@pytest.mark.parametrize("tc", range(1, 6))
+def test_word_count_replicated(tc, extra_args, target_bytes,
+                               record_property, tmp_path):
+    """wordCount on TC{tc} replicated: every count scales exactly."""
+    input_file = tmp_path / "input.txt"
+    _, scale = _replicate(os.path.join(AUX_DIR, "P3", f"TC{tc}.txt"),
+                          input_file, target_bytes)
+    _run_timed(record_property, P3_PROGRAM, str(input_file), str(tmp_path),
+               extra_args)
+
+    actual_counts, actual_total = _parse_word_count_output(
+        str(tmp_path / "WordCountResults.txt"))
+    expected_counts, expected_total = parse_p3_expected(tc)
+
+    assert actual_counts == {
+        word: count * scale for word, count in expected_counts.items()
+    }
+    if expected_total:
+        assert actual_total == expected_total * scale
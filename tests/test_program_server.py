@@ -0,0 +1,301 @@
+"""Tests for the resident program server and its drop-in client.
+
+A single server is started for the module; every program is then run
+through the client and compared to a direct command-line run.
+"""
+
+import os
+import queue
+import shutil
+import signal
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+
+import pytest
+
+from tests.conftest import (
+    assert_same_output, run_program, run_pylint, ROOT_DIR,
+)
+
+SERVER_DIR = os.path.join(ROOT_DIR, "server")
+SERVER = os.path.join(SERVER_DIR, "programServer.py")
+CLIENT = os.path.join(SERVER_DIR, "programClient.py")
+PROTOCOL = os.path.join(SERVER_DIR, "programProtocol.py")
+PROGRAM_DIRS = {
+    "computeStatistics": "P1",
+    "convertNumbers": "P2",
+    "wordCount": "P3",
+}
+
+CASES = [
+    ("computeStatistics", os.path.join(ROOT_DIR, "P1", "tests", "TC5.txt"),
+     (), "StatisticsResults.txt"),
+    ("convertNumbers", os.path.join(ROOT_DIR, "P2", "tests", "TC4.txt"),
+     (), "ConvertionResults.txt"),
+    ("wordCount", os.path.join(ROOT_DIR, "P3", "tests", "TC2.txt"),
+     (), "WordCountResults.txt"),
+    ("wordCount", os.path.join(ROOT_DIR, "P3", "tests", "TC5.txt"),
+     ("--max-words", "50"), "WordCountResults.txt"),
+    # Server workers are daemons; --workers must fall back to serial.
+    ("computeStatistics", os.path.join(ROOT_DIR, "P1", "tests", "TC3.txt"),
+     ("--workers", "2"), "StatisticsResults.txt"),
+    ("convertNumbers", os.path.join(ROOT_DIR, "P2", "tests", "TC4.txt"),
+     ("--workers", "2"), "ConvertionResults.txt"),
+    ("wordCount", os.path.join(ROOT_DIR, "P3", "tests", "TC5.txt"),
+     ("--workers", "2"), "WordCountResults.txt"),
+]
+
+
+@pytest.fixture(scope="module")
+def server_socket():
+    """Start a server on a private socket and yield its path."""
+    # AF_UNIX paths are length-limited, so keep this one short.
+    socket_dir = tempfile.mkdtemp(prefix="pgs-")
+    socket_path = os.path.join(socket_dir, "server.sock")
+    process = subprocess.Popen(
+        [sys.executable, SERVER, "--socket", socket_path, "--workers", "2"],
+        stdout=subprocess.DEVNULL,
+    )
+    try:
+        deadline = time.time() + 30
+        while not os.path.exists(socket_path):
+            assert process.poll() is None, "server exited during start-up"
+            assert time.time() < deadline, "server did not start"
+            time.sleep(0.05)
+        yield socket_path
+    finally:
+        process.send_signal(signal.SIGINT)
+        try:
+            process.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            process.kill()
+        shutil.rmtree(socket_dir, ignore_errors=True)
+
+
+@pytest.fixture
+def server_module(monkeypatch):
+    """Import ``programServer`` from the server directory."""
+    monkeypatch.syspath_prepend(SERVER_DIR)
+    return __import__("programServer")
+
+
+@pytest.fixture
+def client_module(monkeypatch):
+    """Import ``programClient`` the way it imports ``programProtocol``."""
+    monkeypatch.syspath_prepend(SERVER_DIR)
+    return __import__("programClient")
+
+
+def _run_client(socket_path, program, input_file, args, working_dir):
+    """Run the client CLI against *socket_path* in *working_dir*."""
+    env = dict(os.environ, PROGRAM_SERVER_SOCKET=socket_path)
+    return subprocess.run(
+        [sys.executable, CLIENT, program, input_file, *args],
+        capture_output=True, text=True, cwd=working_dir, env=env,
+        timeout=120, check=False,
+    )
+
+
+# ------------------------------------------------------------------
+# Client is a drop-in for the command line
+# ------------------------------------------------------------------
+
+@pytest.mark.parametrize("program, input_file, args, output_name", CASES)
+def test_client_matches_cli(server_socket, program, input_file, args,
+                            output_name, tmp_path):
+    """Client output and results file match a direct CLI run."""
+    cli_dir = tmp_path / "cli"
+    client_dir = tmp_path / "client"
+    cli_dir.mkdir()
+    client_dir.mkdir()
+
+    program_path = os.path.join(ROOT_DIR, PROGRAM_DIRS[program], "source",
+                                f"{program}.py")
+    expected = run_program(program_path, input_file,
+                           working_dir=str(cli_dir), extra_args=args)
+    actual = _run_client(server_socket, program, input_file, args,
+                         str(client_dir))
+
+    assert_same_output((actual, client_dir), (expected, cli_dir),
+                       output_name)
+
+
+def test_client_reports_usage_errors(server_socket, tmp_path):
+    """A bad option is reported with the program's own exit status."""
+    input_file = os.path.join(ROOT_DIR, "P3", "tests", "TC1.txt")
+    result = _run_client(server_socket, "wordCount", input_file,
+                         ("--max-words", "zero"), str(tmp_path))
+    assert result.returncode == 1
+    assert result.stdout.startswith("Usage:")
+
+
+def test_client_falls_back_without_server(tmp_path):
+    """With no server listening the client runs the program locally."""
+    input_file = os.path.join(ROOT_DIR, "P2", "tests", "TC3.txt")
+    result = _run_client(str(tmp_path / "missing.sock"), "convertNumbers",
+                         input_file, (), str(tmp_path))
+    assert result.returncode == 0, result.stderr
+    assert (tmp_path / "ConvertionResults.txt").exists()
+
+
+# ------------------------------------------------------------------
+# Pipelining
+# ------------------------------------------------------------------
+
+def test_pipelined_responses_keep_request_order(server_socket, client_module):
+    """Requests sent back-to-back on one connection answer in order."""
+    jobs = [(program, input_file, args)
+            for program, input_file, args, _ in CASES] * 3
+    sock = client_module.connect(server_socket)
+    assert sock is not None
+    with sock:
+        responses = client_module.run_pipelined(sock, jobs)
+
+    assert len(responses) == len(jobs)
+    for (_, _, _, output_name), response in zip(CASES * 3, responses):
+        assert response["returncode"] == 0, response["stderr"]
+        assert response["output_name"] == output_name
+        assert response["output"]
+
+
+def test_unknown_program_is_rejected(server_socket, client_module):
+    """The server answers an unknown program with an error response."""
+    input_file = os.path.join(ROOT_DIR, "P3", "tests", "TC1.txt")
+    sock = client_module.connect(server_socket)
+    with sock:
+        client_module.send_request(sock, "noSuchProgram", input_file)
+        response = client_module.receive_response(sock)
+    assert response["returncode"] == 2
+    assert "unknown program" in response["stderr"]
+
+
+class _FailedJob:
+    """Stand-in for an AsyncResult whose worker died."""
+
+    def get(self):
+        """Raise like a job lost with its worker."""
+        raise RuntimeError("worker died")
+
+
+class _DoneJob:
+    """Stand-in for a finished AsyncResult."""
+
+    def __init__(self, response):
+        self.response = response
+
+    def get(self):
+        """Return the stored response."""
+        return self.response
+
+
+def test_failed_job_does_not_stall_pipeline(server_module, tmp_path):
+    """A job that raises is answered with an error; later ones still go."""
+    server_end, client_end = socket.socketpair()
+    handler = server_module.ProgramRequestHandler.__new__(
+        server_module.ProgramRequestHandler)
+    handler.request = server_end
+
+    pending = queue.Queue()
+    payloads = [tmp_path / f"payload{i}.txt" for i in range(2)]
+    for payload in payloads:
+        payload.write_text("1\n", encoding="utf-8")
+    done = {"returncode": 0, "stdout": "ok", "stderr": "",
+            "output_name": None, "output": None}
+    pending.put((_FailedJob(), str(payloads[0])))
+    pending.put((_DoneJob(done), str(payloads[1])))
+    pending.put(None)
+
+    with server_end, client_end:
+        handler.send_responses(pending)
+        first = server_module.recv_frame(client_end)
+        second = server_module.recv_frame(client_end)
+
+    failed = server_module.json.loads(first.decode("utf-8"))
+    assert failed["returncode"] == 1
+    assert "worker died" in failed["stderr"]
+    assert server_module.json.loads(second.decode("utf-8")) == done
+    assert not any(payload.exists() for payload in payloads)
+
+
+def test_cut_short_payload_is_removed(server_module, tmp_path):
+    """A client that disconnects mid-payload leaves no spool file."""
+    server_end, client_end = socket.socketpair()
+    with server_end:
+        with client_end:
+            # One 4-byte data frame, then EOF before the empty frame.
+            client_end.sendall(b"\x00\x00\x00\x041\n2\n")
+        with pytest.raises(ConnectionError):
+            server_module.receive_payload(server_end, str(tmp_path))
+    assert not list(tmp_path.iterdir())
+
+
+def test_client_skips_server_imports(tmp_path):
+    """The client loads only the protocol module, not the server."""
+    env = dict(os.environ, PROGRAM_SERVER_SOCKET=str(tmp_path / "x.sock"))
+    result = subprocess.run(
+        [sys.executable, "-c",
+         "import sys, programClient; "
+         "print(sorted({'programServer', 'multiprocessing', "
+         "'socketserver'} & set(sys.modules)))"],
+        capture_output=True, text=True, cwd=SERVER_DIR, env=env,
+        timeout=60, check=False,
+    )
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip() == "[]"
+
+
+# ------------------------------------------------------------------
+# Socket path safety
+# ------------------------------------------------------------------
+
+def _start_server(socket_path):
+    """Run a server on *socket_path* and return the finished process."""
+    return subprocess.run(
+        [sys.executable, SERVER, "--socket", socket_path, "--workers", "1"],
+        capture_output=True, text=True, timeout=30, check=False,
+    )
+
+
+def test_server_refuses_to_replace_regular_file(tmp_path):
+    """A regular file at the socket path is left alone."""
+    path = tmp_path / "not-a-socket"
+    path.write_text("keep me", encoding="utf-8")
+    result = _start_server(str(path))
+    assert result.returncode != 0
+    assert "is not a socket" in result.stderr
+    assert path.read_text(encoding="utf-8") == "keep me"
+
+
+def test_server_refuses_live_socket(server_socket):
+    """A socket with a listening server is not taken over."""
+    result = _start_server(server_socket)
+    assert result.returncode != 0
+    assert "already listening" in result.stderr
+    assert os.path.exists(server_socket)
+
+
+def test_server_replaces_stale_socket(server_module):
+    """A socket nobody listens on is removed before binding."""
+    socket_dir = tempfile.mkdtemp(prefix="pgs-")
+    socket_path = os.path.join(socket_dir, "stale.sock")
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as stale:
+            stale.bind(socket_path)
+        server_module.remove_stale_socket(socket_path)
+        assert not os.path.exists(socket_path)
+    finally:
+        shutil.rmtree(socket_dir, ignore_errors=True)
+
+
+# ------------------------------------------------------------------
+# Static analysis
+# ------------------------------------------------------------------
+
+@pytest.mark.parametrize("path", [SERVER, CLIENT, PROTOCOL])
+def test_pylint_score(path):
+    """The server, client and protocol must score 10.00/10 on pylint."""
+    score = run_pylint(path)
+    assert score == pytest.approx(10.0), f"pylint score is {score}"
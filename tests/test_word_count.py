@@ -8,7 +8,10 @@ import os
 
 import pytest
 
-from tests.conftest import run_program, run_pylint, parse_p3_expected, ROOT_DIR
+from tests.conftest import (
+    assert_matches_default_run, heavy_imports, load_program, run_program,
+    run_pylint, parse_p3_expected, ROOT_DIR,
+)
 
 PROGRAM = os.path.join(ROOT_DIR, "P3", "source", "wordCount.py")
 TESTS_DIR = os.path.join(ROOT_DIR, "P3", "tests")
@@ -90,6 +93,26 @@ def test_functional_correctness(tc, tmp_path):
         )
 
 
+# ------------------------------------------------------------------
+# Multiprocess backend
+# ------------------------------------------------------------------
+
+@pytest.mark.parametrize("tc", range(1, 6))
+def test_workers_match_serial(tc, tmp_path):
+    """wordCount TC{tc}: ``--workers 3`` output matches serial."""
+    input_file = os.path.join(TESTS_DIR, f"TC{tc}.txt")
+    assert_matches_default_run(PROGRAM, input_file, "WordCountResults.txt",
+                               tmp_path, ("--workers", "3"))
+
+
+def test_workers_split_lines_like_text_mode(tmp_path):
+    """A lone carriage return ends a line with workers, as in text mode."""
+    input_file = tmp_path / "input.txt"
+    input_file.write_bytes(b"a\rb\nc\r\nb\n" * 1000)
+    assert_matches_default_run(PROGRAM, str(input_file), "WordCountResults.txt",
+                               tmp_path, ("--workers", "2"))
+
+
 # ------------------------------------------------------------------
 # Static analysis
 # ------------------------------------------------------------------
@@ -98,3 +121,48 @@ def test_pylint_score():
     """wordCount.py must score 10.00/10 on pylint."""
     score = run_pylint(PROGRAM)
     assert score == pytest.approx(10.0), f"pylint score is {score}"
+
+
+# ------------------------------------------------------------------
+# External (spill-to-disk) sort
+# ------------------------------------------------------------------
+
+@pytest.mark.parametrize("tc", range(1, 6))
+@pytest.mark.parametrize("max_words", [1, 7, 100])
+def test_external_sort_matches_in_memory(tc, max_words, tmp_path):
+    """wordCount TC{tc}: ``--max-words`` output matches in-memory."""
+    input_file = os.path.join(TESTS_DIR, f"TC{tc}.txt")
+    assert_matches_default_run(PROGRAM, input_file, "WordCountResults.txt",
+                               tmp_path, ("--max-words", str(max_words)))
+
+
+def test_merge_removes_consumed_runs(tmp_path):
+    """Every run file is deleted once merged, across several passes."""
+    word_count = load_program(PROGRAM)
+    runs = [word_count.write_run([(f"w{index:03d}", 1)], str(tmp_path))
+            for index in range(2 * word_count.MERGE_FAN_IN + 1)]
+    merged = list(word_count.merge_runs(runs, word_count.word_key,
+                                        str(tmp_path)))
+    assert [word for word, _ in merged] == sorted(
+        f"w{index:03d}" for index in range(len(runs)))
+    assert not list(tmp_path.iterdir())
+
+
+@pytest.mark.parametrize("args", [
+    ("--max-words", "\u00b2"),
+    ("--max-words", "0"),
+    ("--max-words", "5", "--workers", "2"),
+])
+def test_usage_errors(args, tmp_path):
+    """Malformed options print usage and exit 1 without a traceback."""
+    input_file = os.path.join(TESTS_DIR, "TC1.txt")
+    result = run_program(PROGRAM, input_file, working_dir=str(tmp_path),
+                         extra_args=args)
+    assert result.returncode == 1, result.stderr
+    assert result.stdout.startswith("Usage:")
+
+
+def test_default_run_skips_heavy_imports(tmp_path):
+    """A serial run does not import multiprocessing and friends."""
+    input_file = os.path.join(TESTS_DIR, "TC1.txt")
+    assert heavy_imports(PROGRAM, input_file, str(tmp_path)) == "[]"